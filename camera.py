@@ -1,8 +1,5 @@
 from __future__ import annotations
 import pygame as pg
-import sys 
-
-
 
 
 class Camera:
@@ -10,9 +7,12 @@ class Camera:
     camera class to handle view transformations and follow player
     manages the offset for rendering objects relative to player position
     """
+    __slots__ = ('game', 'x', 'y', 'ix', 'iy')
+
     def __init__(self, game) -> None:
         self.game = game
         self.x, self.y = 0, 0  # camera offset coordinates
+        self.ix, self.iy = 0, 0  # rounded screen offset, added directly to world pixel positions
 
     def update(self):
         """update camera position to keep player centered on screan"""
@@ -20,10 +20,23 @@ class Camera:
         # calculate camera offset to center player in viewport
         self.x = player_x * self.game.tile_size - self.game.half_width
         self.y = player_y * self.game.tile_size - self.game.half_height
+        # round once per frame so every draw call can just add the offset
+        self.ix = -round(self.x)
+        self.iy = -round(self.y)
 
     def apply(self, pos):
         """
         apply camera offset to world position for rendering
-        rounds coordinates at render time to avoid visual gaps betwen tiles
+        the offset is rounded once per frame to avoid visual gaps betwen tiles
         """
-        return round(pos[0] - self.x), round(pos[1] - self.y)
\ No newline at end of file
+        return pos[0] + self.ix, pos[1] + self.iy
+
+    @property
+    def view_rect_tiles(self):
+        """visible area in tile coordinates, rounded outwards to whole tiles"""
+        tile_size = self.game.tile_size
+        left = int(self.x // tile_size)
+        top = int(self.y // tile_size)
+        right = int((self.x + self.game.current_res[0]) // tile_size) + 1
+        bottom = int((self.y + self.game.current_res[1]) // tile_size) + 1
+        return pg.Rect(left, top, right - left, bottom - top)
@@ -183,6 +183,10 @@ PROPS_SIZES = {
 ENCLOSURE_BASE_PRICE = 100
 ENCLOSURE_COST_PER_TILE = 50
 
+# smallest and largest enclosure side in tiles, for the shop buttons and the mouse wheel
+ENCLOSURE_MIN_SIZE = 3
+ENCLOSURE_MAX_SIZE = 15
+
 # prop prices and income (price, income per second)
 # decorative props have zero income, functional buildings genrate money
 PROP_PRICES = {
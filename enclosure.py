@@ -1,9 +1,36 @@
 from __future__ import annotations
 import pygame as pg
 import random
+from itertools import chain
+from math import cos, sin, pi
 
 from utils import *
 
+# enclosures with more animals than this bucket them in a one tile grid for collision checks
+# below it a plain scan over every animal is cheaper than maintaining the grid
+GRID_MIN_ANIMALS = 8
+
+# bound once, the movement tick draws several random numbers per animal and
+# random.uniform(a, b) is just a + (b - a) * random() wrapped in a python call
+_random = random.random
+
+# neighbours snapshot with nobody in it, shared read only by every lone animal
+_NO_NEIGHBOURS = ((), (), (), -1, None)
+
+# seconds between two stat decay passes, stats drop by at most 0.2 per second
+# so nothing visible changes between passes
+STATS_UPDATE_INTERVAL = 1.0
+
+# (cos, sin) of 64 evenly spaced angles, used to pick walking directions without trig calls
+_UNIT_CIRCLE = tuple((cos(2 * pi * k / 64), sin(2 * pi * k / 64)) for k in range(64))
+
+# facing direction indexed by (horizontal dominant << 2) | (dx > 0) << 1 | (dy > 0)
+# vertical movement only looks at dy, horizontal movement only looks at dx
+_DIRECTION_LUT = (
+    Direction.NORTH, Direction.SOUTH, Direction.NORTH, Direction.SOUTH,
+    Direction.WEST, Direction.WEST, Direction.EAST, Direction.EAST
+)
+
 
 class Enclosure(Props):
     """
@@ -19,8 +46,24 @@ class Enclosure(Props):
         self.height = height
         self.animals = []
         self.is_enclosure = True
+        # fence pieces as (EnclosureType, dx, dy) relative to the top left tile, filled by the map
+        self.fence_tiles = []
+        # area covered in tile coordinates, used to find enclosures out of view
+        self.tile_rect = pg.Rect(x, y, width, height)
+        # simulated time not yet applied while the enclosure is off screen
+        self.pending_time = 0
+        # time not yet applied to the animal stats, see decay_stats
+        self.stats_time = 0
         # calculate max capacity based on enclosure size (4 tiles per animal)
         self.max_animals = (width-1) * (height-1) // 4
+        # movement limits in tiles with a small margin to keep animals inside
+        # the enclosure never moves or resizes, so this is computed once
+        self.boundaries = (
+            x + 1,  # min_x
+            y + 1,  # min_y
+            x + width - 1,  # max_x
+            y + height - 1   # max_y
+        )
 
     def add_animal(self, animal: Animal) -> None:
         """adds an animal to the enclosure if theres space available"""
@@ -39,24 +82,92 @@ class Enclosure(Props):
     
     def update_animals(self, delta_time: float) -> None:
         """
-        updates all animals in the enclosure with proper boundaries
-        also handles collision detection between animals
+        updates all animals in the enclosure, stats first then movement
         
         args:
             delta_time: time elapsed since last frame in seconds
         """
-        # define enclosure boundaries with small margin to keep animals inside
-        boundaries = (
-            self.x + 1,  # min_x
-            self.y + 1,  # min_y
-            self.x + self.width - 1,  # max_x
-            self.y + self.height - 1   # max_y
-        )
+        # stats decay linearly and slowly, so elapsed time is accumulated and the whole
+        # enclosure is decayed in one fused pass every STATS_UPDATE_INTERVAL seconds
+        self.stats_time += delta_time
+        if self.stats_time >= STATS_UPDATE_INTERVAL:
+            self.decay_stats(self.stats_time)
+            self.stats_time = 0
+        
+        self.update_movement(delta_time)
+    
+    def decay_stats(self, elapsed: float) -> None:
+        """
+        decreases the stats of every animal in the enclosure
+        the decay is the same for every animal, so the amounts are computed once
         
-        # update each animal with list of other animals for colision avoidance
+        args:
+            elapsed: time in seconds to apply
+        """
+        hunger_decay = 0.1 * elapsed
+        thirst_decay = 0.1 * elapsed
+        happiness_decay = 0.05 * elapsed
+        health_decay = 0.2 * elapsed
         for animal in self.animals:
-            other_animals = [a for a in self.animals if a != animal]
-            animal.update(delta_time, boundaries, other_animals)
+            # work on locals and clamp with plain comparisons instead of max() calls
+            hunger = animal.hunger - hunger_decay
+            if hunger < 0:
+                hunger = 0
+            thirst = animal.thirst - thirst_decay
+            if thirst < 0:
+                thirst = 0
+            happiness = animal.happiness - happiness_decay
+            animal.happiness = happiness if happiness > 0 else 0
+            animal.hunger = hunger
+            animal.thirst = thirst
+            # health decreases if animal is hungry or thirsty
+            if hunger == 0 or thirst == 0:
+                health = animal.health - health_decay
+                animal.health = health if health > 0 else 0
+    
+    def update_movement(self, delta_time: float) -> None:
+        """
+        moves and animates every animal in the enclosure
+        also handles collision detection between animals
+        
+        args:
+            delta_time: time elapsed since last frame in seconds
+        """
+        boundaries = self.boundaries
+        animals = self.animals
+        
+        # a lone animal has nobody to collide with, skip building the snapshot
+        if len(animals) <= 1:
+            for animal in animals:
+                animal.update_motion(delta_time, boundaries, _NO_NEIGHBOURS)
+            return
+        
+        # positions and radii as flat parallel lists (structure of arrays), built once
+        # per tick and shared by every animal for colision avoidance
+        xs = [animal.x for animal in animals]
+        ys = [animal.y for animal in animals]
+        radii = [animal.collision_radius for animal in animals]
+        
+        # broadphase grid of one tile cells -> animal indices, collision distances are
+        # below one tile so only the 3x3 cells around a position have to be checked
+        grid = None
+        if len(animals) > GRID_MIN_ANIMALS:
+            grid = {}
+            for i in range(len(animals)):
+                grid.setdefault((int(xs[i]), int(ys[i])), []).append(i)
+        
+        for i, animal in enumerate(animals):
+            # take the animal out of the grid while it moves so it never collides with itself
+            if grid is not None:
+                grid[(int(xs[i]), int(ys[i]))].remove(i)
+            
+            animal.update_motion(delta_time, boundaries, (xs, ys, radii, i, grid))
+            # write back so later animals see this one where it actually is now
+            xs[i] = animal.x
+            ys[i] = animal.y
+            
+            if grid is not None:
+                grid.setdefault((int(xs[i]), int(ys[i])), []).append(i)
 
 
 
@@ -67,6 +178,14 @@ class Animal:
     represents an animal in the game with stats, movement and animation
     animals move randomly within enclosure boundaries and avoid colliding with each other
     """
+    __slots__ = (
+        'species', 'x', 'y',
+        'hunger', 'thirst', 'happiness', 'health',
+        'direction', 'speed', 'move_timer', 'move_interval', 'target_x', 'target_y',
+        'is_idle', 'idle_timer', 'idle_duration', 'previous_animation',
+        'animation_timer', 'walk_animation_speed', 'idle_animation_speed', 'current_frame',
+        'collision_radius'
+    )
     
     def __init__(self, species: str, x: float, y: float) -> None:
         self.species = species
@@ -93,7 +212,7 @@ class Animal:
         self.is_idle = False  # true when animal is paused
         self.idle_timer = 0  # time spent idle
         self.idle_duration = 0  # duration of current idle period
-        self.previous_animation = 'walk'  # track animation changes
+        self.previous_animation = AnimationState.WALK  # track animation changes
         
         # animation variables
         self.animation_timer = 0  # elapsed time for animation
@@ -120,11 +239,11 @@ class Animal:
         """increase health stat by given amount (capped at 100)"""
         self.health = min(100, self.health + health_amount)
     
-    def get_current_animation(self) -> str:
-        """returns the name of current animation (idle or walk)"""
-        return 'idle' if self.is_idle else 'walk'
+    def get_current_animation(self) -> AnimationState:
+        """returns the current animation state (idle or walk), ANIMATION_NAMES gives its name"""
+        return AnimationState.IDLE if self.is_idle else AnimationState.WALK
     
-    def check_collision_with_others(self, new_x: float, new_y: float, other_animals: list) -> bool:
+    def check_collision_with_others(self, new_x: float, new_y: float, neighbours: tuple) -> bool:
         """
         checks if a position would cause collision with other animals
         uses collision radius to determine if animals are too close
@@ -132,19 +251,37 @@ class Animal:
         args:
             new_x: x position to test
             new_y: y position to test
-            other_animals: list of other animals in enclosure
+            neighbours: tuple (xs, ys, radii, self_index, grid) of parallel lists with the
+                        positions and radii of the animals in the enclosure, the entry
+                        at self_index is this animal and is skipped (-1 for none)
+                        grid is none or a dict of one tile cells -> indices that
+                        doesnt contain this animal (radii must stay under half a tile)
             
         returns:
             true if collision detected, false otherwise
         """
-        for other in other_animals:
+        xs, ys, radii, self_index, grid = neighbours
+        if grid is None:
+            # walk the indices before and after our own one, no per-entry skip test
+            candidates = chain(range(self_index), range(self_index + 1, len(xs)))
+        else:
+            # only the animals in the 3x3 cells around the tested position can be close enough
+            cell_x, cell_y = int(new_x), int(new_y)
+            candidates = chain.from_iterable(
+                grid.get((cx, cy), ())
+                for cx in (cell_x - 1, cell_x, cell_x + 1)
+                for cy in (cell_y - 1, cell_y, cell_y + 1)
+            )
+        
+        radius = self.collision_radius
+        for j in candidates:
             # calculate distance between this position and other animal
-            dx = new_x - other.x
-            dy = new_y - other.y
-            distance = (dx**2 + dy**2)**0.5
+            dx = new_x - xs[j]
+            dy = new_y - ys[j]
             
-            # check if too close (collision detected)
-            if distance < (self.collision_radius + other.collision_radius):
+            # check if too close (collision detected), compared squared to skip the sqrt
+            reach = radius + radii[j]
+            if dx * dx + dy * dy < reach * reach:
                 return True
         
         return False
@@ -154,20 +291,43 @@ class Animal:
         updates animal stats, movement and animation each frame
         handles stat degradation and health loss when hungry or thirsty
         """
+        self.update_stats(delta_time)
+        if other_animals is None:
+            other_animals = []
+        neighbours = (
+            [other.x for other in other_animals],
+            [other.y for other in other_animals],
+            [other.collision_radius for other in other_animals],
+            -1,
+            None
+        )
+        self.update_motion(delta_time, enclosure_boundaries, neighbours)
+
+    def update_stats(self, delta_time: float) -> None:
+        """decreases stats over time, enclosures do this in a batched pass instead"""
         # decrease all stats over time
-        self.hunger = max(0, self.hunger - 0.1 * delta_time)
-        self.thirst = max(0, self.thirst - 0.1 * delta_time)
-        self.happiness = max(0, self.happiness - 0.05 * delta_time)
+        hunger = self.hunger - 0.1 * delta_time
+        thirst = self.thirst - 0.1 * delta_time
+        happiness = self.happiness - 0.05 * delta_time
+        self.hunger = hunger = hunger if hunger > 0 else 0
+        self.thirst = thirst = thirst if thirst > 0 else 0
+        self.happiness = happiness if happiness > 0 else 0
         
         # health decreases if animal is hungry or thirsty
-        if self.hunger == 0 or self.thirst == 0:
-            self.health = max(0, self.health - 0.2 * delta_time)
-        
+        if hunger == 0 or thirst == 0:
+            health = self.health - 0.2 * delta_time
+            self.health = health if health > 0 else 0
+
+    def update_motion(self, delta_time: float, enclosure_boundaries: tuple = None, neighbours: tuple = None) -> None:
+        """
+        updates movement and animation frame, without touching the stats
+        neighbours uses the (xs, ys, radii, self_index, grid) layout of check_collision_with_others
+        """
         # random movement if boundaries are provided
         if enclosure_boundaries:
-            if other_animals is None:
-                other_animals = []
-            self.random_movement(delta_time, enclosure_boundaries, other_animals)
+            if neighbours is None:
+                neighbours = _NO_NEIGHBOURS
+            self.random_movement(delta_time, enclosure_boundaries, neighbours)
         
         # detect animation change and reset frame if necessary
         current_animation = self.get_current_animation()
@@ -176,14 +336,31 @@ class Animal:
             self.animation_timer = 0
             self.previous_animation = current_animation
         
-        # update animation frame based on current state
-        current_speed = self.idle_animation_speed if self.is_idle else self.walk_animation_speed
-        self.animation_timer += delta_time
-        if self.animation_timer >= current_speed:
-            self.animation_timer = 0
+        # update animation frame based on current state, the flag picks the speed
+        current_speed = (self.walk_animation_speed, self.idle_animation_speed)[self.is_idle]
+        animation_timer = self.animation_timer + delta_time
+        if animation_timer >= current_speed:
+            animation_timer = 0
             self.current_frame += 1
+        self.animation_timer = animation_timer
 
-    def random_movement(self, delta_time: float, boundaries: tuple, other_animals: list) -> None:
+    def pick_target(self, boundaries: tuple) -> None:
+        """
+        chooses a new target a short walk away (1 to 3 tiles in a random direction)
+        nearby targets mean shorter paths across the enclosure and fewer collisions
+        
+        args:
+            boundaries: tuple (min_x, min_y, max_x, max_y) defining enclosure limits in tiles
+        """
+        min_x, min_y, max_x, max_y = boundaries
+        radius = 1.0 + 2.0 * _random()
+        cos_angle, sin_angle = _UNIT_CIRCLE[int(_random() * len(_UNIT_CIRCLE))]
+        target_x = self.x + radius * cos_angle
+        target_y = self.y + radius * sin_angle
+        self.target_x = min_x if target_x < min_x else max_x if target_x > max_x else target_x
+        self.target_y = min_y if target_y < min_y else max_y if target_y > max_y else target_y
+
+    def random_movement(self, delta_time: float, boundaries: tuple, neighbours: tuple) -> None:
         """
         moves animal randomly within enclosure boundaries
         handles idle periods, target selection and collision avoidance
@@ -191,10 +368,8 @@ class Animal:
         args:
             delta_time: time elapsed since last frame in seconds
             boundaries: tuple (min_x, min_y, max_x, max_y) defining enclosure limits in tiles
-            other_animals: list of other animals in enclosure to avoid collisions
+            neighbours: (xs, ys, radii, self_index, grid) of the animals in the enclosure to avoid collisions
         """
-        min_x, min_y, max_x, max_y = boundaries
-        
         # handle idle state (animal standing still)
         if self.is_idle:
             self.idle_timer += delta_time
@@ -203,10 +378,9 @@ class Animal:
                 self.is_idle = False
                 self.idle_timer = 0
                 # immediately choose new target position
-                self.target_x = random.uniform(min_x, max_x)
-                self.target_y = random.uniform(min_y, max_y)
+                self.pick_target(boundaries)
                 self.move_timer = 0
-                self.move_interval = random.uniform(1.5, 3.0)
+                self.move_interval = 1.5 + 1.5 * _random()
             else:
                 # stay still during idle period
                 return
@@ -217,64 +391,58 @@ class Animal:
         # change direction at random intervals
         if self.move_timer >= self.move_interval:
             self.move_timer = 0
-            self.move_interval = random.uniform(1.5, 3.0)
+            self.move_interval = 1.5 + 1.5 * _random()
             
             # 30% chance to enter idle instead of moving
-            if random.random() < 0.3:
+            if _random() < 0.3:
                 self.is_idle = True
-                self.idle_duration = random.uniform(2.0, 4.0)  # idle for 2-4 seconds
+                self.idle_duration = 2.0 + 2.0 * _random()  # idle for 2-4 seconds
                 return
             
             # choose new random target position within boundaries
-            self.target_x = random.uniform(min_x, max_x)
-            self.target_y = random.uniform(min_y, max_y)
+            self.pick_target(boundaries)
         
         # calculate direction towards target
         dx = self.target_x - self.x
         dy = self.target_y - self.y
-        distance = (dx**2 + dy**2)**0.5
+        distance_squared = dx * dx + dy * dy
         
         # if close to target (less than 0.1 tile), enter idle state
-        if distance < 0.1:
+        if distance_squared < 0.01:
             if not self.is_idle:
                 self.is_idle = True
-                self.idle_duration = random.uniform(1.0, 2.5)  # short pause before next movement
+                self.idle_duration = 1.0 + 1.5 * _random()  # short pause before next movement
                 self.idle_timer = 0
             return
         
         # normalize direction and apply speed with delta_time
-        if distance > 0:
-            dx = (dx / distance) * self.speed * delta_time
-            dy = (dy / distance) * self.speed * delta_time
+        if distance_squared > 0:
+            # one scale factor for both axes, the inverse square root replaces sqrt plus division
+            step = self.speed * delta_time * distance_squared ** -0.5
+            dx *= step
+            dy *= step
             
             # calculate new position
             new_x = self.x + dx
             new_y = self.y + dy
             
-            # ensure animal stays within boundaries
-            new_x = stick_in_range(new_x, min_x, max_x)
-            new_y = stick_in_range(new_y, min_y, max_y)
+            # ensure animal stays within boundaries, unpacked only here since
+            # idle and arriving animals return before ever needing them
+            min_x, min_y, max_x, max_y = boundaries
+            new_x = min_x if new_x < min_x else max_x if new_x > max_x else new_x
+            new_y = min_y if new_y < min_y else max_y if new_y > max_y else new_y
             
             # check collisions with other animals
-            if not self.check_collision_with_others(new_x, new_y, other_animals):
+            if not self.check_collision_with_others(new_x, new_y, neighbours):
                 # no collision, we can move
                 self.x = new_x
                 self.y = new_y
             else:
                 # collision detected, choose new target after short pause
                 self.is_idle = True
-                self.idle_duration = random.uniform(0.5, 1.5)  # short pause
+                self.idle_duration = 0.5 + 1.0 * _random()  # short pause
                 self.idle_timer = 0
                 return
             
             # update visual direction based on dominant movement axis
-            if abs(dx) > abs(dy):
-                if dx > 0:
-                    self.direction = Direction.EAST
-                else:
-                    self.direction = Direction.WEST
-            else:
-                if dy > 0:
-                    self.direction = Direction.SOUTH
-                else:
-                    self.direction = Direction.NORTH
+            self.direction = _DIRECTION_LUT[((abs(dx) > abs(dy)) << 2) | ((dx > 0) << 1) | (dy > 0)]
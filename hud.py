@@ -1,13 +1,117 @@
 from __future__ import annotations
 import pygame as pg
 from enum import Enum
+from functools import lru_cache
 from typing import Callable, Optional, Tuple
 
 from utils import *
-from enclosure import *
+from enclosure import Animal
 from config import *
 
 
+# hud palette, shared so the same tuple objects are used as text cache keys
+SHOP_NAME_COLOR = (255, 255, 230)  # name of a shop item
+SHOP_PRICE_COLOR = (255, 215, 100)  # price of a shop item
+SHOP_INFO_COLOR = (230, 230, 200)  # info line of a shop item
+SHOP_INCOME_COLOR = (150, 255, 150)  # income line of an animal
+SHOP_BORDER_COLOR = (200, 200, 150)  # border of a shop row
+SHOP_AFFORD_COLOR = (80, 150, 80)  # row the player can afford
+SHOP_NO_AFFORD_COLOR = (150, 80, 80)  # row the player cannot afford
+MONEY_COLOR = (255, 215, 0)  # money and bulldozer cost
+INCOME_COLOR = (100, 255, 100)  # income per second under the money
+ERROR_COLOR = (255, 50, 50)  # placement error message
+
+SCALE_CACHE_SIZE = 256  # max number of scaled hud images kept around
+TEXT_CACHE_SIZE = 512  # max number of rendered hud texts kept around
+ROW_CACHE_SIZE = 128  # max number of composed shop rows kept around
+OVERLAY_POOL_SIZE = 8  # max number of window sized overlays kept around
+SHOP_CONTENT_OFFSET = 280  # top of the shop item list, relative to the shop window
+SHOP_ITEM_HEIGHT = 70  # height of one shop row
+SHOP_ITEM_SPACING = 15  # gap between two shop rows
+SHOP_PREVIEW_SIZE = 60  # side of the item images in the shop rows (increased from 40)
+# zoom levels x0.25 (16), x0.5 (32), x1 (64), x2 (128), x4 (256), both directions wrap around
+ZOOM_OUT_STEPS = {16: 32, 32: 64, 64: 128, 128: 256, 256: 16}  # next (bigger) tile size
+ZOOM_IN_STEPS = {16: 256, 32: 16, 64: 32, 128: 64, 256: 128}  # previous (smaller) tile size
+ZOOM_LABELS = {16: "x0.25", 32: "x0.5", 64: "x1", 128: "x2", 256: "x4"}
+# shop rows as (name, data, price), the price tables never change so they are only walked once
+PROP_ITEMS = tuple((name, data, data["price"]) for name, data in PROP_PRICES.items())
+ANIMAL_ITEMS = tuple((name, data, data["price"]) for name, data in ANIMAL_PRICES.items())
+# placement error shown for each way an area can be blocked
+AREA_ERRORS = {
+    AreaState.FREE: "",
+    AreaState.OUT_OF_BOUNDS: "Out of bounds",
+    AreaState.PROP: "Area occupied by prop",
+    AreaState.ENCLOSURE: "Area occupied by enclosure",
+}
+MOUSE_EVENTS = frozenset((pg.MOUSEBUTTONDOWN, pg.MOUSEBUTTONUP, pg.MOUSEMOTION, pg.MOUSEWHEEL))  # events the hud handles
+
+
+def crop_transparent_bottom(surface: pg.Surface) -> pg.Surface:
+    """
+    drop the fully transparent rows at the bottom of an image
+    the top left corner does not move, so the image is drawn at the same place
+    and the per-pixel alpha blit skips rows that would not change anything
+    
+    args:
+        surface: image with per-pixel alpha
+    
+    returns:
+        a subsurface sharing the pixels of the image
+    """
+    bottom = surface.get_bounding_rect().bottom
+    return surface.subsurface((0, 0, surface.get_width(), max(1, bottom)))
+
+
+def make_row_background(size: Tuple[int, int], color: Tuple[int, int, int]) -> pg.Surface:
+    """
+    build the semi-transparent background of a shop row, with its border baked in
+    the display mode must already be set since the surface is converted with alpha
+    
+    args:
+        size: size of the row
+        color: fill color of the row (drawn with alpha 180)
+    
+    returns:
+        the background surface
+    """
+    surface = pg.Surface(size, pg.SRCALPHA)
+    surface.fill((*color, 180))
+    pg.draw.rect(surface, SHOP_BORDER_COLOR, surface.get_rect(), 2)
+    # same pixel format as the display, the composed shop rows are copies of it
+    return surface.convert_alpha()
+
+
+@lru_cache(maxsize=64)
+def bulldozer_cost(income_per_second: float) -> int:
+    """
+    cost of one bulldozer use, it grows with the income so it stays meaningful
+    
+    args:
+        income_per_second: current income of the zoo
+    
+    returns:
+        the cost, between the base and the max bulldozer cost
+    """
+    if income_per_second > 0:
+        return max(BULLDOZER_BASE_COST, int(min(income_per_second * 30, BULLDOZER_MAX_COST)))
+    return BULLDOZER_BASE_COST
+
+
+@lru_cache(maxsize=None)
+def enclosure_price(width: int, height: int) -> int:
+    """
+    price of an enclosure, a base price plus a cost per tile
+    
+    args:
+        width: width of the enclosure in tiles
+        height: height of the enclosure in tiles
+    
+    returns:
+        the price of the enclosure
+    """
+    return ENCLOSURE_BASE_PRICE + (width * height * ENCLOSURE_COST_PER_TILE)
+
+
 class ShopTab(Enum):
     """
     enum for different shop tabs available in the game
@@ -20,6 +124,11 @@ class ShopTab(Enum):
     ANIMALS = 2
 
 
+# tabs and their labels indexed by tab value, in the order they are shown
+SHOP_TABS = tuple(ShopTab)
+SHOP_TAB_NAMES = ("ENCLOS", "PROPS", "ANIMALS")  # "ANIMALS" translated from "ANIMAUX"
+
+
 class PlacementMode(Enum):
     """
     enum for different placement modes in the game
@@ -32,11 +141,25 @@ class PlacementMode(Enum):
     BULLDOZER = 4  # destruction mode for removing items
 
 
+# rows and placement mode of the scrollable shop tabs, shared by clicks, hover and scrolling
+SHOP_LIST_TABS = {
+    ShopTab.PROPS: (PROP_ITEMS, PlacementMode.PROP),
+    ShopTab.ANIMALS: (ANIMAL_ITEMS, PlacementMode.ANIMAL),
+}
+
+
 class Button:
     """
     generic reusable button class with optional image support
     handles hover states, click events, and secondary text labels
     """
+    __slots__ = (
+        'rect', '_x0', '_y0', '_x1', '_y1',
+        'text', 'callback', 'image', 'hover_image', 'active_image',
+        'font', '_small_font', 'text_color', 'bg_color', 'hover_color', 'active_color',
+        'is_hovered', '_is_active', 'visible', 'enabled', '_prev_state',
+        'secondary_texts', '_text_cache', '_text_blits', '_state_surfaces', '_current_draw_surface'
+    )
     
     def __init__(self, x: int, y: int, width: int, height: int, 
                  text: str = "", 
@@ -45,6 +168,7 @@ class Button:
                  hover_image: Optional[pg.Surface] = None,
                  active_image: Optional[pg.Surface] = None,
                  font: Optional[pg.font.Font] = None,
+                 small_font: Optional[pg.font.Font] = None,
                  text_color: Tuple[int, int, int] = (255, 255, 255),
                  bg_color: Optional[Tuple[int, int, int]] = None,
                  hover_color: Optional[Tuple[int, int, int]] = None,
@@ -63,6 +187,7 @@ class Button:
             hover_image: image when mouse hovers over (optional)
             active_image: image when button is active (optional)
             font: font for text rendering
+            small_font: font for secondary texts too wide for the button (optional, shared)
             text_color: color of the text
             bg_color: background color if no image provided
             hover_color: color when hovering
@@ -71,6 +196,8 @@ class Button:
             enabled: whether button is enabled initially
         """
         self.rect = pg.Rect(x, y, width, height)
+        # plain int bounds of rect for the per-frame hover test, refreshed by set_position
+        self._x0, self._y0, self._x1, self._y1 = self.rect.left, self.rect.top, self.rect.right, self.rect.bottom
         self.text = text
         self.callback = callback
         self.image = image
@@ -82,25 +209,138 @@ class Button:
         self.hover_color = hover_color or (150, 150, 150)
         self.active_color = active_color
         self.is_hovered = False
-        self.is_active = False
+        self._is_active = False
         self.visible = visible
         self.enabled = enabled
+        # (visible, hovered, active) when state_changed() was last called
+        self._prev_state = None
         
         # secondary texts for displaying prices, etc
         self.secondary_texts = []
+        
+        # rendered text surfaces keyed by (text, color), cleared whenever the texts change
+        self._text_cache = {}
+        # text blits with their positions, rebuilt when texts or position change, see layout_texts()
+        self._text_blits = None
+        # smaller font used when a secondary text is too wide, built once instead of every frame
+        self._small_font = small_font
+        if font and not small_font:
+            self._small_font = pg.font.Font(None, int(font.get_height() * 0.6))
+        
+        # pre-rendered background (fill + border) per state color, for buttons without image
+        self._state_surfaces = {}
+        if not image:
+            for color in (self.bg_color, self.hover_color, self.active_color):
+                if color:
+                    self.get_state_surface(color)
+        
+        # image or background matching the current state, see refresh_state()
+        self._current_draw_surface = None
+        self.refresh_state()
+    
+    @property
+    def is_active(self) -> bool:
+        """whether the button is shown as active (e.g. its mode is on)"""
+        return self._is_active
+    
+    @is_active.setter
+    def is_active(self, value: bool):
+        self._is_active = value
+        self.refresh_state()
+    
+    def refresh_state(self):
+        """pick the image (or colored background) to draw, called whenever hover or active state changes"""
+        # choose appropriate image based on state
+        if self._is_active and self.active_image:
+            self._current_draw_surface = self.active_image
+        elif self.is_hovered and self.hover_image:
+            self._current_draw_surface = self.hover_image
+        elif self.image:
+            self._current_draw_surface = self.image
+        else:
+            # colored background
+            if self._is_active and self.active_color:
+                color = self.active_color
+            elif self.is_hovered:
+                color = self.hover_color
+            else:
+                color = self.bg_color
+            self._current_draw_surface = self.get_state_surface(color)
     
     def set_position(self, x: int, y: int):
         """change the button position"""
         self.rect.x = x
         self.rect.y = y
+        self._x0, self._y0, self._x1, self._y1 = self.rect.left, self.rect.top, self.rect.right, self.rect.bottom
+        self._text_blits = None
+        # the rect may also have been resized, which changes the colored background
+        self.refresh_state()
+    
+    def set_text(self, text: str):
+        """change the main text of the button"""
+        if text != self.text:
+            self.text = text
+            self._text_cache.clear()
+            self._text_blits = None
     
     def add_secondary_text(self, text: str, color: Tuple[int, int, int], offset_y: int = 0):
         """add a secondary text below the main text"""
         self.secondary_texts.append((text, color, offset_y))
+        self._text_cache.clear()
+        self._text_blits = None
     
     def clear_secondary_texts(self):
         """clear all secondary texts"""
         self.secondary_texts = []
+        self._text_cache.clear()
+        self._text_blits = None
+    
+    def render_text(self, text: str, color: Tuple[int, int, int], fit: bool = False) -> pg.Surface:
+        """
+        render a text with the button font, reusing the cached surface when possible
+        
+        args:
+            text: text to render
+            color: text color
+            fit: use the smaller font if the text is wider than the button
+        
+        returns:
+            the rendered text surface
+        """
+        key = (text, color, fit)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            surface = self.font.render(text, True, color)
+            # if text exceeds button width, use smaller font
+            if fit and surface.get_width() > self.rect.width - 10:
+                surface = self._small_font.render(text, True, color)
+            self._text_cache[key] = surface
+        return surface
+    
+    def state_changed(self) -> bool:
+        """
+        check if the look of the button changed since the last call
+        
+        returns:
+            true if visibility, hover or active state changed
+        """
+        state = (self.visible, self.is_hovered, self.is_active)
+        changed = state != self._prev_state
+        self._prev_state = state
+        return changed
+    
+    def get_state_surface(self, color: Tuple[int, int, int]) -> pg.Surface:
+        """
+        get the pre-rendered background of the button for a color
+        the surface is rebuilt if the button size changed since it was made
+        """
+        surface = self._state_surfaces.get(color)
+        if surface is None or surface.get_size() != self.rect.size:
+            surface = pg.Surface(self.rect.size)
+            surface.fill(color)
+            pg.draw.rect(surface, (255, 255, 255), surface.get_rect(), 2)
+            self._state_surfaces[color] = surface
+        return surface
     
     def handle_event(self, event) -> bool:
         """
@@ -113,7 +353,8 @@ class Button:
             return False
         
         if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
+            mx, my = event.pos
+            if self._x0 <= mx < self._x1 and self._y0 <= my < self._y1:
                 if self.callback:
                     self.callback()
                 return True
@@ -125,62 +366,64 @@ class Button:
         if not self.visible:
             return
         
-        self.is_hovered = self.rect.collidepoint(mouse_pos) and self.enabled
+        mx, my = mouse_pos
+        is_hovered = self._x0 <= mx < self._x1 and self._y0 <= my < self._y1 and self.enabled
+        if is_hovered != self.is_hovered:
+            self.is_hovered = is_hovered
+            self.refresh_state()
     
     def draw(self, screen: pg.Surface):
         """draw the button on screen"""
         if not self.visible:
             return
         
-        # choose appropriate image based on state
-        current_image = None
-        if self.is_active and self.active_image:
-            current_image = self.active_image
-        elif self.is_hovered and self.hover_image:
-            current_image = self.hover_image
-        elif self.image:
-            current_image = self.image
+        screen.blits(self.get_blits(), doreturn=0)
+    
+    def get_blits(self) -> list:
+        """
+        build the (surface, position) pairs needed to draw the button
         
-        # draw image or background
-        if current_image:
-            screen.blit(current_image, self.rect.topleft)
-        else:
-            # draw colored background
-            if self.is_active and self.active_color:
-                color = self.active_color
-            elif self.is_hovered:
-                color = self.hover_color
-            else:
-                color = self.bg_color
-            
-            pg.draw.rect(screen, color, self.rect)
-            pg.draw.rect(screen, (255, 255, 255), self.rect, 2)
+        returns:
+            list of blits in drawing order (background, main text, secondary texts)
+        """
+        if self._text_blits is None:
+            self._text_blits = self.layout_texts()
+        return [(self._current_draw_surface, self.rect.topleft)] + self._text_blits
+    
+    def layout_texts(self) -> list:
+        """
+        render and place the main and secondary texts, the result is kept until
+        the texts or the button position change
+        
+        returns:
+            list of (surface, position) blits for the texts
+        """
+        blits = []
         
         # draw main text
         if self.text and self.font:
-            text_surface = self.font.render(self.text, True, self.text_color)
+            text_surface = self.render_text(self.text, self.text_color)
             text_rect = text_surface.get_rect(center=(self.rect.centerx, self.rect.centery - (len(self.secondary_texts) * 10)))
-            screen.blit(text_surface, text_rect)
+            blits.append((text_surface, text_rect.topleft))
         
         # draw secondary texts
         for i, (sec_text, sec_color, offset_y) in enumerate(self.secondary_texts):
             if self.font:
                 # adapt font size if text is too long
-                sec_surface = self.font.render(sec_text, True, sec_color)
-                
-                # if text exceeds button width, use smaller font
-                if sec_surface.get_width() > self.rect.width - 10:
-                    # create smaller font (reduce by 20%)
-                    smaller_font = pg.font.Font(self.font.get_fontpath() if hasattr(self.font, 'get_fontpath') else None, 
-                                                int(self.font.get_height() * 0.6))
-                    sec_surface = smaller_font.render(sec_text, True, sec_color)
+                sec_surface = self.render_text(sec_text, sec_color, fit=True)
                 
                 sec_rect = sec_surface.get_rect(center=(self.rect.centerx, self.rect.centery + 20 + (i * 15) + offset_y))
-                screen.blit(sec_surface, sec_rect)
+                blits.append((sec_surface, sec_rect.topleft))
+        
+        return blits
 
 
 class ShopItem:
     """generic class for shop items in the store interface"""
+    __slots__ = (
+        'rect', 'name', 'price', 'on_click', 'can_afford', 'info_text',
+        '_bg_afford', '_bg_no', '_text_fonts', '_name_surf', '_price_surf', '_info_surf'
+    )
     
     def __init__(self, x: int, y: int, width: int, height: int,
                  name: str, price: int, 
@@ -205,6 +448,14 @@ class ShopItem:
         self.on_click = on_click
         self.can_afford = can_afford
         self.info_text = info_text
+        
+        # semi-transparent backgrounds with the border baked in, one per affordability state
+        self._bg_afford = make_row_background(self.rect.size, SHOP_AFFORD_COLOR)
+        self._bg_no = make_row_background(self.rect.size, SHOP_NO_AFFORD_COLOR)
+        
+        # rendered texts, built on first draw for the fonts they were drawn with
+        self._text_fonts = None
+        self._name_surf = self._price_surf = self._info_surf = None
     
     def handle_event(self, event) -> bool:
         """handle click on the item"""
@@ -217,26 +468,25 @@ class ShopItem:
     
     def draw(self, screen: pg.Surface, name_font: pg.font.Font, info_font: pg.font.Font):
         """draw the shop item"""
+        # render texts again only if the fonts changed
+        if self._text_fonts != (id(name_font), id(info_font)):
+            self._text_fonts = (id(name_font), id(info_font))
+            self._name_surf = name_font.render(self.name, True, SHOP_NAME_COLOR)
+            self._price_surf = name_font.render(f"${self.price}", True, SHOP_PRICE_COLOR)
+            self._info_surf = info_font.render(self.info_text, True, SHOP_INFO_COLOR) if self.info_text else None
+        
         # semi-transparent background
-        item_surface = pg.Surface((self.rect.width, self.rect.height))
-        item_surface.set_alpha(180)
-        color = (80, 150, 80) if self.can_afford else (150, 80, 80)
-        item_surface.fill(color)
-        screen.blit(item_surface, self.rect.topleft)
-        pg.draw.rect(screen, (200, 200, 150), self.rect, 2)
+        screen.blit(self._bg_afford if self.can_afford else self._bg_no, self.rect.topleft)
         
         # name
-        name_text = name_font.render(self.name, True, (255, 255, 230))
-        screen.blit(name_text, (self.rect.left + 15, self.rect.top + 8))
+        screen.blit(self._name_surf, (self.rect.left + 15, self.rect.top + 8))
         
         # price
-        price_text = name_font.render(f"${self.price}", True, (255, 215, 100))
-        screen.blit(price_text, (self.rect.right - price_text.get_width() - 15, self.rect.top + 8))
+        screen.blit(self._price_surf, (self.rect.right - self._price_surf.get_width() - 15, self.rect.top + 8))
         
         # info
-        if self.info_text:
-            info_surface = info_font.render(self.info_text, True, (230, 230, 200))
-            screen.blit(info_surface, (self.rect.left + 15, self.rect.top + 35))
+        if self._info_surf:
+            screen.blit(self._info_surf, (self.rect.left + 15, self.rect.top + 35))
 
 
 class HUD:
@@ -247,107 +497,141 @@ class HUD:
     def __init__(self, game) -> None:
         self.game = game
         
+        # set when the renderer textures must be reloaded, see reload_textures()
+        self.textures_dirty = False
+        
+        # scaled copies of hud images keyed by (id of the source, size), see scaled()
+        self._scale_cache = {}
+        # rendered texts, see render_text()
+        self._text_cache = {}
+        # composed shop rows keyed by (tab, name, can afford), see get_shop_row()
+        self._row_surfaces = {}
+        # money amount currently rendered in money_text, it changes too often to go through the text cache
+        self.money_shown = None
+        self.money_text = None
+        # shop background with the tabs drawn on it and the tab state it shows, see get_shop_chrome()
+        self._shop_chrome = None
+        self._shop_chrome_key = None
+        # window sized translucent overlays keyed by (resolution, color), see get_overlay_surface()
+        self._overlay_surfaces = {}
+        
         # load custom font
         font_path = "media/hud/font/soupofjustice.ttf"
+        self.font_path = font_path
         self.font = pg.font.Font(font_path, 36)
         self.small_font = pg.font.Font(font_path, 24)
         self.medium_font = pg.font.Font(font_path, 30)
+        # fallback for button labels too wide for their button (60% of the small font)
+        self.auto_small_font = pg.font.Font(font_path, int(self.small_font.get_height() * 0.6))
+        # shop tab labels never change, indexed by tab value like SHOP_TAB_NAMES
+        self.tab_labels = tuple(self.medium_font.render(name, True, (255, 255, 255)) for name in SHOP_TAB_NAMES)
+        # enclosure size selector texts, the sizes are bounded so every value is rendered up front
+        self.width_label = self.medium_font.render("Width:", True, (0, 0, 0))
+        self.height_label = self.medium_font.render("Height:", True, (0, 0, 0))
+        self.size_value_texts = {size: self.font.render(f"{size}", True, (0, 0, 0))
+                                 for size in range(ENCLOSURE_MIN_SIZE, ENCLOSURE_MAX_SIZE + 1)}
         
         # load hud images
-        self.shop_bg_img = pg.image.load("media/hud/backgrounds/shop.png").convert_alpha()
-        btn_img_original = pg.image.load("media/hud/buttons/btn.png").convert_alpha()
-        btn_hover_original = pg.image.load("media/hud/buttons/btn_hover.png").convert_alpha()
-        btn_active_original = pg.image.load("media/hud/buttons/btn_activated.png").convert_alpha()
+        self.shop_bg_img = load_image("media/hud/backgrounds/shop.png")
+        btn_img_original = load_image("media/hud/buttons/btn.png")
+        btn_hover_original = load_image("media/hud/buttons/btn_hover.png")
+        btn_active_original = load_image("media/hud/buttons/btn_activated.png")
         
         # load new shop and bulldozer button images (text already included)
-        shop_btn_img_original = pg.image.load("media/hud/buttons/shop.png").convert_alpha()
-        shop_btn_hover_original = pg.image.load("media/hud/buttons/shop_hover.png").convert_alpha()
-        shop_btn_active_original = pg.image.load("media/hud/buttons/shop_activated.png").convert_alpha()
+        shop_btn_img_original = load_image("media/hud/buttons/shop.png")
+        shop_btn_hover_original = load_image("media/hud/buttons/shop_hover.png")
+        shop_btn_active_original = load_image("media/hud/buttons/shop_activated.png")
         
-        bulldozer_btn_img_original = pg.image.load("media/hud/buttons/buldozer.png").convert_alpha()
-        bulldozer_btn_hover_original = pg.image.load("media/hud/buttons/buldozer_hover.png").convert_alpha()
-        bulldozer_btn_active_original = pg.image.load("media/hud/buttons/buldozer_activated.png").convert_alpha()
+        bulldozer_btn_img_original = load_image("media/hud/buttons/buldozer.png")
+        bulldozer_btn_hover_original = load_image("media/hud/buttons/buldozer_hover.png")
+        bulldozer_btn_active_original = load_image("media/hud/buttons/buldozer_activated.png")
         
         # load pause menu button images
-        play_btn_img_original = pg.image.load("media/hud/buttons/play.png").convert_alpha()
-        play_btn_hover_original = pg.image.load("media/hud/buttons/play_hover.png").convert_alpha()
-        quit_btn_img_original = pg.image.load("media/hud/buttons/quit.png").convert_alpha()
-        quit_btn_hover_original = pg.image.load("media/hud/buttons/quit_hover.png").convert_alpha()
+        play_btn_img_original = load_image("media/hud/buttons/play.png")
+        play_btn_hover_original = load_image("media/hud/buttons/play_hover.png")
+        quit_btn_img_original = load_image("media/hud/buttons/quit.png")
+        quit_btn_hover_original = load_image("media/hud/buttons/quit_hover.png")
         
         # load pause menu background
-        self.pause_bg_img = pg.image.load("media/hud/backgrounds/pause.png").convert_alpha()
+        self.pause_bg_img = load_image("media/hud/backgrounds/pause.png")
         
         # scale shop and bulldozer buttons to 110x110 (increased from 90)
-        shop_btn_img = pg.transform.scale(shop_btn_img_original, (110, 110))
-        shop_btn_hover = pg.transform.scale(shop_btn_hover_original, (110, 110))
-        shop_btn_active = pg.transform.scale(shop_btn_active_original, (110, 110))
+        shop_btn_img = self.scaled(shop_btn_img_original, (110, 110))
+        shop_btn_hover = self.scaled(shop_btn_hover_original, (110, 110))
+        shop_btn_active = self.scaled(shop_btn_active_original, (110, 110))
         
-        bulldozer_btn_img = pg.transform.scale(bulldozer_btn_img_original, (110, 110))
-        bulldozer_btn_hover = pg.transform.scale(bulldozer_btn_hover_original, (110, 110))
-        bulldozer_btn_active = pg.transform.scale(bulldozer_btn_active_original, (110, 110))
+        bulldozer_btn_img = self.scaled(bulldozer_btn_img_original, (110, 110))
+        bulldozer_btn_hover = self.scaled(bulldozer_btn_hover_original, (110, 110))
+        bulldozer_btn_active = self.scaled(bulldozer_btn_active_original, (110, 110))
         
         # scale pause menu buttons - squares like shop and bulldozer (110x110)
-        play_btn_img = pg.transform.scale(play_btn_img_original, (110, 110))
-        play_btn_hover = pg.transform.scale(play_btn_hover_original, (110, 110))
-        quit_btn_img = pg.transform.scale(quit_btn_img_original, (110, 110))
-        quit_btn_hover = pg.transform.scale(quit_btn_hover_original, (110, 110))
+        play_btn_img = self.scaled(play_btn_img_original, (110, 110))
+        play_btn_hover = self.scaled(play_btn_hover_original, (110, 110))
+        quit_btn_img = self.scaled(quit_btn_img_original, (110, 110))
+        quit_btn_hover = self.scaled(quit_btn_hover_original, (110, 110))
         
         # scale pause menu background (same scale as shop: 60%)
         original_pause_width, original_pause_height = self.pause_bg_img.get_size()
         pause_scale_factor = 0.6
         self.pause_width = int(original_pause_width * pause_scale_factor)
         self.pause_height = int(original_pause_height * pause_scale_factor)
-        self.pause_bg_img = pg.transform.scale(self.pause_bg_img, (self.pause_width, self.pause_height))
+        self.pause_bg_img = self.scaled(self.pause_bg_img, (self.pause_width, self.pause_height))
         
         # load close button images with hover state
-        close_img_original = pg.image.load("media/hud/buttons/close_2.png").convert_alpha()
-        close_hover_original = pg.image.load("media/hud/buttons/close_2_hover.png").convert_alpha()
-        minus_img_original = pg.image.load("media/hud/buttons/minus.png").convert_alpha()
-        plus_img_original = pg.image.load("media/hud/buttons/plus.png").convert_alpha()
+        close_img_original = load_image("media/hud/buttons/close_2.png")
+        close_hover_original = load_image("media/hud/buttons/close_2_hover.png")
+        minus_img_original = load_image("media/hud/buttons/minus.png")
+        plus_img_original = load_image("media/hud/buttons/plus.png")
         
         # load mode screen images
-        self.construction_mode_img_original = pg.image.load("media/hud/screen/construction_mode.png").convert_alpha()
-        self.placement_mode_img_original = pg.image.load("media/hud/screen/placement_mode.png").convert_alpha()
-        self.destruction_mode_img_original = pg.image.load("media/hud/screen/destruction_mode.png").convert_alpha()
+        self.construction_mode_img_original = load_image("media/hud/screen/construction_mode.png")
+        self.placement_mode_img_original = load_image("media/hud/screen/placement_mode.png")
+        self.destruction_mode_img_original = load_image("media/hud/screen/destruction_mode.png")
         
         # resize mode screens (80% of screen width max)
-        screen_width, screen_height = self.game.current_res
-        mode_scale = min(screen_width * 0.8 / 1536, 1.0)  # 1536 is the original width
-        mode_width = int(1536 * mode_scale)
-        mode_height = int(331 * mode_scale)
-        self.construction_mode_img = pg.transform.scale(self.construction_mode_img_original, (mode_width, mode_height))
-        self.placement_mode_img = pg.transform.scale(self.placement_mode_img_original, (mode_width, mode_height))
-        self.destruction_mode_img = pg.transform.scale(self.destruction_mode_img_original, (mode_width, mode_height))
+        self.resize_mode_images()
         
         # shop dimensions based on image (increased from 50% to 60%)
         original_width, original_height = self.shop_bg_img.get_size()
         scale_factor = 0.6  # increased from 0.5
         self.shop_width = int(original_width * scale_factor)
         self.shop_height = int(original_height * scale_factor)
-        self.shop_bg_img = pg.transform.scale(self.shop_bg_img, (self.shop_width, self.shop_height))
+        self.shop_bg_img = self.scaled(self.shop_bg_img, (self.shop_width, self.shop_height))
+        # shop row backgrounds indexed by can afford (red, green), the row size follows the fixed shop width
+        row_size = (self.shop_width - 230, SHOP_ITEM_HEIGHT)
+        self.row_backgrounds = (make_row_background(row_size, SHOP_NO_AFFORD_COLOR), make_row_background(row_size, SHOP_AFFORD_COLOR))
         
         # get prop and animal images from renderer (no need to load separately)
         # renderer already loads them in game.renderer
         
         # load enclosure image (use one of the custom enclosures)
         try:
-            self.enclosure_image = pg.image.load("media/custom_enclosures/0.png").convert_alpha()
+            self.enclosure_image = load_image("media/custom_enclosures/0.png")
         except:
             self.enclosure_image = None
         
+        # shop previews, scaled once from the textures of the starting zoom
+        self.shop_previews = self.build_shop_previews()
+        
         # resize button images
-        btn_img = pg.transform.scale(btn_img_original, (180, 60))
-        btn_hover = pg.transform.scale(btn_hover_original, (180, 60))
-        btn_active = pg.transform.scale(btn_active_original, (180, 60))
-        close_img = pg.transform.scale(close_img_original, (60, 60))
-        close_hover = pg.transform.scale(close_hover_original, (60, 60))
+        btn_img = self.scaled(btn_img_original, (180, 60))
+        btn_hover = self.scaled(btn_hover_original, (180, 60))
+        btn_active = self.scaled(btn_active_original, (180, 60))
+        close_img = self.scaled(close_img_original, (60, 60))
+        close_hover = self.scaled(close_hover_original, (60, 60))
         small_button_size = 50
-        minus_img = pg.transform.scale(minus_img_original, (small_button_size, small_button_size))
-        plus_img = pg.transform.scale(plus_img_original, (small_button_size, small_button_size))
+        minus_img = self.scaled(minus_img_original, (small_button_size, small_button_size))
+        plus_img = self.scaled(plus_img_original, (small_button_size, small_button_size))
         
         # shop state
         self.shop_open = False
         self.current_tab = ShopTab.ENCLOSURES
+        # content drawer of each tab, see draw_shop_content()
+        self.tab_drawers = {
+            ShopTab.ENCLOSURES: self.draw_enclosure_tab,
+            ShopTab.PROPS: self.draw_item_list_tab,
+            ShopTab.ANIMALS: self.draw_item_list_tab,
+        }
         
         # placement mode
         self.placement_mode = PlacementMode.NONE
@@ -385,10 +669,12 @@ class HUD:
             image=bulldozer_btn_img,
             hover_image=bulldozer_btn_hover,
             active_image=bulldozer_btn_active,
-            font=self.small_font
+            font=self.small_font,
+            small_font=self.auto_small_font
         )
         # we'll update the price display dynamically - centered
-        self.bulldozer_button.add_secondary_text(f"${BULLDOZER_BASE_COST}", (255, 215, 0), 10)  # y_offset=10 (lowered by 25)
+        self.bulldozer_button.add_secondary_text(f"${BULLDOZER_BASE_COST}", MONEY_COLOR, 10)  # y_offset=10 (lowered by 25)
+        self.bulldozer_cost_shown = BULLDOZER_BASE_COST  # cost currently written on the button
         self.buttons.append(self.bulldozer_button)
         
         # speed buttons - bottom left, same line as zoom
@@ -453,9 +739,6 @@ class HUD:
         self.pause_quit_button = None
         self.pause_rect = None
         
-        # rectangles will be calculated dynamically
-        self.update_shop_rects()
-        
         # buttons to adjust enclosure size
         self.enclosure_width_minus_rect = None
         self.enclosure_width_plus_rect = None
@@ -471,8 +754,16 @@ class HUD:
         # placement error message
         self.placement_error = ""
         
+        # state the hovers and placement checks were last computed for, see update()
+        self.update_signature = None
+        self.input_pending = False
+        # true while the mouse may be over one of the generic buttons, see update()
+        self.buttons_hovered = False
+        
         # pause menu state
         self.pause_menu_open = False
+        # darkened frozen frame with the pause panel, see draw_pause_menu()
+        self.pause_backdrop = None
         
         # store pause button images for later use
         self.play_btn_img = play_btn_img
@@ -487,19 +778,34 @@ class HUD:
         self.scroll_dragging = False  # is user dragging the scrollbar
         self.scroll_drag_start_y = 0  # y position where drag started
         self.scroll_drag_start_offset = 0  # scroll offset when drag started
+        self.scroll_drag_max = 0  # scroll range of the tab being dragged, fixed for the whole drag
+        self.scroll_per_pixel = 0  # scroll offset moved by one pixel of drag, 0 when nothing scrolls
+        # (total items, scroll offset) the shop start index was last computed for, see get_shop_start_index()
+        self._shop_start_key = None
+        self._shop_start_index = 0
         
         # load scrollbar images
-        scroll_bg_original = pg.image.load("media/hud/scrollbar/scroll_background.png").convert_alpha()
-        scroll_cursor_original = pg.image.load("media/hud/scrollbar/scroll_cursor.png").convert_alpha()
+        scroll_bg_original = load_image("media/hud/scrollbar/scroll_background.png")
+        scroll_cursor_original = load_image("media/hud/scrollbar/scroll_cursor.png")
         
         # scale scrollbar images - cursor is square (30x30)
-        self.scroll_bg_img = pg.transform.scale(scroll_bg_original, (30, 400))
-        self.scroll_cursor_img = pg.transform.scale(scroll_cursor_original, (30, 30))
+        # the bar spans the visible rows (at most 400px), they never change so its height is fixed
+        self.scrollbar_height = min(400, self.max_visible_items * (SHOP_ITEM_HEIGHT + SHOP_ITEM_SPACING) - SHOP_ITEM_SPACING)
+        self.scroll_bg_img = self.scaled(self.scaled(scroll_bg_original, (30, 400)), (30, self.scrollbar_height))
+        self.scroll_cursor_img = self.scaled(scroll_cursor_original, (30, 30))
+        self.scroll_cursor_height = self.scroll_cursor_img.get_height()  # never changes, read on every drag and draw
         
         # scrollbar position (will be set in update_shop_rects)
         self.scroll_bar_rect = None
         self.scroll_cursor_rect = None
         
+        # rectangles will be calculated dynamically, and again only when the resolution changes
+        self._shop_rects_res = None
+        # one pixel rect moved to the mouse to hit test rect lists with collidelist
+        self.mouse_probe = pg.Rect(0, 0, 1, 1)
+        self._pause_rects_res = None
+        self.update_shop_rects()
+        
         # initialize pause menu rectangles
         self.update_pause_menu_rects()
     
@@ -542,6 +848,7 @@ class HUD:
     def toggle_pause(self):
         """toggle pause menu"""
         self.pause_menu_open = not self.pause_menu_open
+        self.pause_backdrop = None
         if self.pause_menu_open:
             # close shop and exit placement mode
             self.shop_open = False
@@ -550,24 +857,32 @@ class HUD:
             self.bulldozer_button.is_active = False
             self.exit_mode_button.visible = False
     
+    def pause_menu_changed(self) -> bool:
+        """check if a pause menu button changed its look since the last call"""
+        changed = False
+        for button in (self.pause_play_button, self.pause_quit_button):
+            # no short circuit, every button has to record its current state
+            if button and button.state_changed():
+                changed = True
+        return changed
+    
     def resume_game(self):
         """resume game from pause"""
         self.pause_menu_open = False
+        self.pause_backdrop = None
         self.game.paused= False
     
     def quit_to_menu(self):
         """quit to main menu"""
         self.pause_menu_open = False
+        self.pause_backdrop = None
         self.game.return_to_menu()
     
     def get_total_items_for_tab(self):
         """get the total number of items for the current tab"""
-        if self.current_tab == ShopTab.PROPS:
-            return len(PROP_PRICES)
-        elif self.current_tab == ShopTab.ANIMALS:
-            return len(ANIMAL_PRICES)
-        else:
-            return 0  # enclosures tab doesn't have scrollable items
+        list_tab = SHOP_LIST_TABS.get(self.current_tab)
+        # enclosures tab doesn't have scrollable items
+        return len(list_tab[0]) if list_tab else 0
     
     def get_effective_scroll_range(self):
         """get the effective scroll range (uses virtual slots if items < 50)"""
@@ -596,37 +911,24 @@ class HUD:
     
     def decrease_zoom(self):
         """decrease zoom (increase tile_size) - powers of 2 (base 64=x1)"""
-        # x0.25 (16), x0.5 (32), x1 (64), x2 (128), x4 (256)
-        if self.game.tile_size >= 256:
-            self.game.tile_size = 16
-        elif self.game.tile_size >= 128:
-            self.game.tile_size = 256
-        elif self.game.tile_size >= 64:
-            self.game.tile_size = 128
-        elif self.game.tile_size >= 32:
-            self.game.tile_size = 64
-        else:
-            self.game.tile_size = 32
-        # reload renderer textures with new size
-        self.game.renderer.load_tiles()
-        self.game.renderer.load_props()
-        self.game.renderer.load_enclosures()
-        self.game.renderer.load_animals()
+        self.game.tile_size = ZOOM_OUT_STEPS[self.game.tile_size]
+        # reload renderer textures with new size (done once at the next hud update)
+        self.textures_dirty = True
     
     def increase_zoom(self):
         """increase zoom (decrease tile_size) - powers of 2 (base 64=x1)"""
-        # x0.25 (16), x0.5 (32), x1 (64), x2 (128), x4 (256)
-        if self.game.tile_size <= 16:
-            self.game.tile_size = 256
-        elif self.game.tile_size <= 32:
-            self.game.tile_size = 16
-        elif self.game.tile_size <= 64:
-            self.game.tile_size = 32
-        elif self.game.tile_size <= 128:
-            self.game.tile_size = 64
-        else:
-            self.game.tile_size = 128
-        # reload renderer textures with new size
+        self.game.tile_size = ZOOM_IN_STEPS[self.game.tile_size]
+        # reload renderer textures with new size (done once at the next hud update)
+        self.textures_dirty = True
+    
+    def reload_textures(self):
+        """
+        reload the renderer textures if the zoom or window size changed since the last frame
+        several zoom clicks or resize events in the same frame only trigger one reload
+        """
+        if not self.textures_dirty:
+            return
+        self.textures_dirty = False
         self.game.renderer.load_tiles()
         self.game.renderer.load_props()
         self.game.renderer.load_enclosures()
@@ -634,20 +936,141 @@ class HUD:
     
     def get_zoom_label(self):
         """return zoom label in format x0.25, x0.5, x1, x2, x4 (base=64 is x1)"""
-        if self.game.tile_size <= 16:
-            return "x0.25"
-        elif self.game.tile_size <= 32:
-            return "x0.5"
-        elif self.game.tile_size <= 64:
-            return "x1"
-        elif self.game.tile_size <= 128:
-            return "x2"
+        return ZOOM_LABELS[self.game.tile_size]
+
+    def scaled(self, surface: pg.Surface, size: Tuple[int, int]) -> pg.Surface:
+        """
+        scale a surface, computing each (surface, size) pair only once
+        
+        args:
+            surface: source surface, kept alive by the cache so its id stays unique
+            size: target size
+        
+        returns:
+            the scaled surface
+        """
+        key = (id(surface), size)
+        entry = self._scale_cache.get(key)
+        if entry is None:
+            # drop everything if sources keep changing (e.g. renderer textures after a zoom)
+            if len(self._scale_cache) >= SCALE_CACHE_SIZE:
+                self._scale_cache.clear()
+            entry = self._scale_cache[key] = (surface, pg.transform.scale(surface, size))
+        return entry[1]
+
+    def get_shop_row(self, tab: ShopTab, name: str, data: Optional[dict], price: int, can_afford: bool) -> pg.Surface:
+        """
+        get a shop row with its background, preview and texts already composed
+        a visible row is then a single blit, rows are only built again when their price or affordability changes
+        
+        args:
+            tab: tab the row belongs to
+            name: item name, or the enclosure label for the enclosures tab
+            data: price table entry of the item (unused for enclosures)
+            price: price shown on the row
+            can_afford: whether the player has enough money (green or red background)
+        
+        returns:
+            the row surface, of the size of a shop row
+        """
+        key = (tab, name, can_afford)
+        surface = self._row_surfaces.get(key)
+        if surface is None:
+            if len(self._row_surfaces) >= ROW_CACHE_SIZE:
+                self._row_surfaces.clear()
+            surface = self._row_surfaces[key] = self.build_shop_row(tab, name, data, price, can_afford)
+        return surface
+
+    def build_shop_previews(self) -> dict:
+        """
+        scale every shop preview image once
+        the previews keep their look when zooming, so the shop rows never have to be rebuilt for it
+        
+        returns:
+            dict of (tab, item name) -> preview surface or None, the enclosure preview is under (ShopTab.ENCLOSURES, None)
+        """
+        preview_size = (SHOP_PREVIEW_SIZE, SHOP_PREVIEW_SIZE)
+        images = {(ShopTab.ENCLOSURES, None): self.enclosure_image}
+        for name in PROP_PRICES:
+            images[ShopTab.PROPS, name] = self.game.renderer.get_prop_texture(name)
+        for name in ANIMAL_PRICES:
+            # first frame of idle south animation from renderer
+            images[ShopTab.ANIMALS, name] = self.game.renderer.get_animal_frame(name, 'idle', Direction.SOUTH, 0)
+        return {key: pg.transform.scale(image, preview_size) if image else None for key, image in images.items()}
+
+    def build_shop_row(self, tab: ShopTab, name: str, data: Optional[dict], price: int, can_afford: bool) -> pg.Surface:
+        """compose a shop row, see get_shop_row() for the arguments"""
+        width, height = self.shop_row_rects[0].size
+        row = self.row_backgrounds[can_afford].copy()
+        
+        # info line depends on the tab
+        if tab == ShopTab.ENCLOSURES:
+            preview = self.shop_previews[ShopTab.ENCLOSURES, None]
+            label = name
+            info_text = self.small_font.render("Click to buy and place", True, SHOP_INFO_COLOR)
+        elif tab == ShopTab.PROPS:
+            preview = self.shop_previews[ShopTab.PROPS, name]
+            label = name.capitalize()
+            size = PROPS_SIZES.get(name, (1, 1))
+            info_text = self.small_font.render(f"+${data['income']}/s | Size: {int(size[0])}x{int(size[1])}", True, SHOP_INFO_COLOR)
         else:
-            return "x4"
+            preview = self.shop_previews[ShopTab.ANIMALS, name]
+            label = name.capitalize()
+            info_text = self.small_font.render(f"Income: +${data['income']}/s", True, SHOP_INCOME_COLOR)
+        
+        # image preview
+        if preview:
+            row.blit(preview, (5, (height - SHOP_PREVIEW_SIZE) // 2))
+        
+        # text (offset to make room for image)
+        text_offset = SHOP_PREVIEW_SIZE + 15
+        name_text = self.medium_font.render(label, True, SHOP_NAME_COLOR)
+        price_text = self.medium_font.render(f"${price}", True, SHOP_PRICE_COLOR)
+        row.blit(name_text, (text_offset, 10))
+        row.blit(price_text, (width - price_text.get_width() - 15, 10))
+        row.blit(info_text, (text_offset, 40))
+        return row
+
+    def get_overlay_surface(self, color: Tuple[int, int, int, int]) -> pg.Surface:
+        """
+        get a window sized surface filled with a semi-transparent color
+        it is only filled once per color, the pause menu and placement previews blit all or part of it
+        """
+        key = (self.game.current_res, color)
+        surface = self._overlay_surfaces.get(key)
+        if surface is None:
+            if len(self._overlay_surfaces) >= OVERLAY_POOL_SIZE:
+                self._overlay_surfaces.clear()
+            surface = self._overlay_surfaces[key] = pg.Surface(self.game.current_res)
+            surface.set_alpha(color[3])
+            surface.fill(color[:3])
+        return surface
+
+    def render_text(self, font: pg.font.Font, text: str, color: Tuple[int, int, int]) -> pg.Surface:
+        """
+        render a text with one of the hud fonts, reusing the surface if it was already rendered
+        
+        args:
+            font: hud font to use
+            text: text to render
+            color: text color
+        
+        returns:
+            the rendered text surface
+        """
+        key = (id(font), text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            if len(self._text_cache) >= TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+            surface = self._text_cache[key] = font.render(text, True, color)
+        return surface
 
     def handle_resize(self):
         """update all button positions when window is resized"""
         screen_width, screen_height = self.game.current_res
+        # the overlays are window sized, the old ones will not be used again
+        self._overlay_surfaces.clear()
         small_button_size = 50
         
         # shop button - top right
@@ -664,14 +1087,14 @@ class HUD:
         self.zoom_minus_button.set_position(330, screen_height - 60)
         self.zoom_plus_button.set_position(390, screen_height - 60)
         
+        # the pause backdrop was taken at the old size
+        self.pause_backdrop = None
+        
         # resize construction mode images
         self.resize_mode_images()
         
-        # reload renderer textures with new size
-        self.game.renderer.load_tiles()
-        self.game.renderer.load_props()
-        self.game.renderer.load_enclosures()
-        self.game.renderer.load_animals()
+        # reload renderer textures with new size (done once at the next hud update)
+        self.textures_dirty = True
         
         # update shop rectangles and pause menu
         self.update_shop_rects()
@@ -683,13 +1106,20 @@ class HUD:
         mode_scale = min(screen_width * 0.8 / 1536, 1.0)  # 1536 is the original width
         mode_width = int(1536 * mode_scale)
         mode_height = int(331 * mode_scale)
-        self.construction_mode_img = pg.transform.scale(self.construction_mode_img_original, (mode_width, mode_height))
-        self.placement_mode_img = pg.transform.scale(self.placement_mode_img_original, (mode_width, mode_height))
-        self.destruction_mode_img = pg.transform.scale(self.destruction_mode_img_original, (mode_width, mode_height))
+        self.construction_mode_img = crop_transparent_bottom(self.scaled(self.construction_mode_img_original, (mode_width, mode_height)))
+        self.placement_mode_img = crop_transparent_bottom(self.scaled(self.placement_mode_img_original, (mode_width, mode_height)))
+        self.destruction_mode_img = crop_transparent_bottom(self.scaled(self.destruction_mode_img_original, (mode_width, mode_height)))
+        # the three banners share their width, so they are all centered at the same x
+        self.mode_img_x = (screen_width - mode_width) // 2
 
     def update_shop_rects(self):
         """update shop rectangles based on screen size"""
-        screen_width, screen_height = self.game.current_res
+        # the layout only depends on the resolution
+        current_res = self.game.current_res
+        if self._shop_rects_res == current_res:
+            return
+        self._shop_rects_res = current_res
+        screen_width, screen_height = current_res
         
         # update position and size of exit mode button
         # lowered by 30px (from -40 to -10) and shifted 150px left (from -50 to -200)
@@ -698,6 +1128,10 @@ class HUD:
             self.exit_mode_button.rect.height = 120  # increased from 60
             self.exit_mode_button.set_position(screen_width - 200, -10)  # descended by 30px and moved left by 150px
         
+        # area covered by the generic buttons, they all have their final position by now
+        if hasattr(self, 'buttons'):
+            self.buttons_area = self.buttons[0].rect.unionall([button.rect for button in self.buttons])
+        
         # center the shop
         shop_x = (screen_width - self.shop_width) // 2
         shop_y = (screen_height - self.shop_height) // 2
@@ -712,11 +1146,11 @@ class HUD:
         total_tabs_width = 3 * tab_width + 2 * tab_spacing
         start_x = shop_x + (self.shop_width - total_tabs_width) // 2
         
-        self.tab_buttons = {
-            ShopTab.ENCLOSURES: pg.Rect(start_x, tab_y, tab_width, tab_height),
-            ShopTab.PROPS: pg.Rect(start_x + tab_width + tab_spacing, tab_y, tab_width, tab_height),
-            ShopTab.ANIMALS: pg.Rect(start_x + 2 * (tab_width + tab_spacing), tab_y, tab_width, tab_height)
-        }
+        # one rect per tab, indexed by tab value
+        self.tab_buttons = [
+            pg.Rect(start_x + tab.value * (tab_width + tab_spacing), tab_y, tab_width, tab_height)
+            for tab in SHOP_TABS
+        ]
         
         # close button (top right) - moved down 100px
         close_size = 60
@@ -734,7 +1168,7 @@ class HUD:
             self.shop_close_button.set_position(shop_x + self.shop_width - close_size - 20, shop_y + 120)
         
         # buttons to adjust enclosure size (in enclosures tab)
-        content_y = shop_y + 280  # changed from 180 to 280
+        content_y = shop_y + SHOP_CONTENT_OFFSET
         button_size = 50
         
         # calculate centered positions for size selectors
@@ -760,15 +1194,38 @@ class HUD:
         self.enclosure_height_minus_rect = pg.Rect(height_minus_x, content_y + 100, button_size, button_size)
         self.enclosure_height_plus_rect = pg.Rect(height_minus_x + 140, content_y + 100, button_size, button_size)
         
+        # size buttons as (rect, attribute, step) and the area around them, clicks outside it skip the table
+        self.enclosure_size_buttons = (
+            (self.enclosure_width_minus_rect, 'enclosure_width', -1),
+            (self.enclosure_width_plus_rect, 'enclosure_width', 1),
+            (self.enclosure_height_minus_rect, 'enclosure_height', -1),
+            (self.enclosure_height_plus_rect, 'enclosure_height', 1),
+        )
+        self.enclosure_size_rects = [rect for rect, _, _ in self.enclosure_size_buttons]
+        self.enclosure_size_area = self.enclosure_width_minus_rect.unionall(self.enclosure_size_rects)
+        # area covered by the tabs
+        self.tab_bar_rect = self.tab_buttons[0].unionall(self.tab_buttons)
+        
+        # one rect per visible shop row, shared by hover, clicks and drawing (row 0 is also the enclosure item)
+        self.shop_row_rects = [
+            pg.Rect(selector_start_x, content_y + row * (SHOP_ITEM_HEIGHT + SHOP_ITEM_SPACING), selector_width, SHOP_ITEM_HEIGHT)
+            for row in range(self.max_visible_items)
+        ]
+        
         # initialize scrollbar position (will be drawn dynamically based on content)
         scrollbar_x = shop_x + self.shop_width - 112  # moved 3px right from -115
         scrollbar_y = content_y
-        self.scroll_bar_rect = pg.Rect(scrollbar_x, scrollbar_y, 30, 400)
+        self.scroll_bar_rect = pg.Rect(scrollbar_x, scrollbar_y, 30, self.scrollbar_height)
         self.scroll_cursor_rect = pg.Rect(scrollbar_x - 1, scrollbar_y, 30, 30)  # cursor 1px left (was -3, now -1 = 2px right)
 
     def update_pause_menu_rects(self):
         """update pause menu rectangles based on screen size"""
-        screen_width, screen_height = self.game.current_res
+        # the layout only depends on the resolution
+        current_res = self.game.current_res
+        if self._pause_rects_res == current_res:
+            return
+        self._pause_rects_res = current_res
+        screen_width, screen_height = current_res
         
         # center the pause menu
         pause_x = (screen_width - self.pause_width) // 2
@@ -809,6 +1266,12 @@ class HUD:
 
     def handle_event(self, event):
         """handle mouse and keyboard events for the hud"""
+        # the hud only reacts to the mouse, every other event is rejected with one set lookup
+        if event.type not in MOUSE_EVENTS:
+            return
+        # a click can change the map or the buttons, the next update has to look again
+        self.input_pending = True
+        
         # if pause menu is open, only pause menu buttons are active
         if self.pause_menu_open:
             if self.pause_play_button and self.pause_play_button.handle_event(event):
@@ -817,48 +1280,58 @@ class HUD:
                 return
             return  # block all other events during pause
         
-        # handle generic buttons first
-        for button in self.buttons:
-            if button.handle_event(event):
-                return  # a button was clicked, stop processing
+        # handle generic buttons first (they only react to left clicks)
+        if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
+            for button in self.buttons:
+                if button.handle_event(event):
+                    return  # a button was clicked, stop processing
         
         if event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
             mouse_pos = event.pos
             
             # if shop is open
             if self.shop_open:
+                # everything the shop reacts to is inside its window
+                if not self.shop_rect.collidepoint(mouse_pos):
+                    return
+                
                 # click on close button
                 if self.shop_close_button and self.shop_close_button.handle_event(event):
                     return
                 
                 # click on tabs
-                for tab, rect in self.tab_buttons.items():
-                    if rect.collidepoint(mouse_pos):
+                if self.tab_bar_rect.collidepoint(mouse_pos):
+                    tab = self.tab_at(mouse_pos)
+                    if tab is not None:
                         self.current_tab = tab
                         self.scroll_offset = 0  # reset scroll when changing tabs
                         return
                 
                 # click on scrollbar cursor (for drag & drop)
                 if self.scroll_cursor_rect and self.scroll_cursor_rect.collidepoint(mouse_pos):
-                    if self.current_tab in [ShopTab.PROPS, ShopTab.ANIMALS]:
+                    if self.current_tab in SHOP_LIST_TABS:
                         self.scroll_dragging = True
                         self.scroll_drag_start_y = mouse_pos[1]
                         self.scroll_drag_start_offset = self.scroll_offset
+                        
+                        # the tab and the scrollbar cannot change during a drag, so the
+                        # pixel to offset ratio is worked out once here instead of on every motion
+                        scrollable_height = self.scroll_bar_rect.height - self.scroll_cursor_height
+                        self.scroll_drag_max = max(0, self.get_effective_scroll_range())
+                        if scrollable_height > 0 and self.scroll_drag_max > 0:
+                            self.scroll_per_pixel = self.scroll_drag_max / scrollable_height
+                        else:
+                            self.scroll_per_pixel = 0
                         return
                 
                 # click on enclosure size buttons (enclosures tab)
-                if self.current_tab == ShopTab.ENCLOSURES:
-                    if self.enclosure_width_minus_rect.collidepoint(mouse_pos):
-                        self.enclosure_width = max(3, self.enclosure_width - 1)
-                        return
-                    elif self.enclosure_width_plus_rect.collidepoint(mouse_pos):
-                        self.enclosure_width = min(15, self.enclosure_width + 1)
-                        return
-                    elif self.enclosure_height_minus_rect.collidepoint(mouse_pos):
-                        self.enclosure_height = max(3, self.enclosure_height - 1)
-                        return
-                    elif self.enclosure_height_plus_rect.collidepoint(mouse_pos):
-                        self.enclosure_height = min(15, self.enclosure_height + 1)
+                if self.current_tab == ShopTab.ENCLOSURES and self.enclosure_size_area.collidepoint(mouse_pos):
+                    self.mouse_probe.topleft = mouse_pos
+                    index = self.mouse_probe.collidelist(self.enclosure_size_rects)
+                    if index >= 0:
+                        _, attribute, step = self.enclosure_size_buttons[index]
+                        size = getattr(self, attribute) + step
+                        setattr(self, attribute, ENCLOSURE_MIN_SIZE if size < ENCLOSURE_MIN_SIZE else ENCLOSURE_MAX_SIZE if size > ENCLOSURE_MAX_SIZE else size)
                         return
                 
                 # click on shop items
@@ -883,47 +1356,33 @@ class HUD:
         
         # mouse motion - handle scrollbar dragging
         elif event.type == pg.MOUSEMOTION:
-            if self.scroll_dragging and self.scroll_bar_rect:
-                # calculate scroll offset based on cursor position
-                mouse_y = event.pos[1]
-                delta_y = mouse_y - self.scroll_drag_start_y
-                
-                # calculate how much scrollbar area is available
-                scrollable_height = self.scroll_bar_rect.height - self.scroll_cursor_img.get_height()
-                
-                # get effective scroll range (uses virtual slots)
-                max_scroll = max(0, self.get_effective_scroll_range())
-                
-                # convert pixel delta to scroll offset
-                if scrollable_height > 0 and max_scroll > 0:
-                    scroll_per_pixel = max_scroll / scrollable_height
-                    new_offset = self.scroll_drag_start_offset + (delta_y * scroll_per_pixel)
-                    self.scroll_offset = max(0, min(max_scroll, new_offset))
+            if self.scroll_dragging and self.scroll_per_pixel:
+                # convert the pixel delta since the drag started to a scroll offset
+                delta_y = event.pos[1] - self.scroll_drag_start_y
+                new_offset = self.scroll_drag_start_offset + (delta_y * self.scroll_per_pixel)
+                self.scroll_offset = max(0, min(self.scroll_drag_max, new_offset))
         
         # mouse wheel - scroll items in shop
         elif event.type == pg.MOUSEWHEEL:
-            if self.shop_open and self.current_tab in [ShopTab.PROPS, ShopTab.ANIMALS]:
+            if self.shop_open and self.current_tab in SHOP_LIST_TABS:
                 # scroll in shop (uses virtual slots for smooth scrolling)
                 max_scroll = max(0, self.get_effective_scroll_range())
                 self.scroll_offset = max(0, min(max_scroll, self.scroll_offset - event.y))
             elif self.placement_mode == PlacementMode.ENCLOSURE:
-                # change enclosure size with mouse wheel
+                # change enclosure size with mouse wheel, within the same limits as the shop buttons
                 if pg.key.get_mods() & pg.KMOD_SHIFT:
-                    self.enclosure_height = max(3, min(10, self.enclosure_height + event.y))
+                    size = self.enclosure_height + event.y
+                    self.enclosure_height = ENCLOSURE_MIN_SIZE if size < ENCLOSURE_MIN_SIZE else ENCLOSURE_MAX_SIZE if size > ENCLOSURE_MAX_SIZE else size
                 else:
-                    self.enclosure_width = max(3, min(10, self.enclosure_width + event.y))
+                    size = self.enclosure_width + event.y
+                    self.enclosure_width = ENCLOSURE_MIN_SIZE if size < ENCLOSURE_MIN_SIZE else ENCLOSURE_MAX_SIZE if size > ENCLOSURE_MAX_SIZE else size
 
     def handle_shop_click(self, mouse_pos):
         """handle clicks in the shop"""
-        # shop content area (relative to shop_rect) - must match draw_shop_content
-        content_y = self.shop_rect.y + 280  # changed from 180 to 280 (moved down 100px)
-        item_height = 70  # increased from 45
-        item_spacing = 15  # reduced from 20
-        
-        if self.current_tab == ShopTab.ENCLOSURES:
-            # select an enclosure to place
-            enclosure_rect = pg.Rect(self.shop_rect.x + 115, content_y, self.shop_width - 230, item_height)  # reduced width by 60px
-            if enclosure_rect.collidepoint(mouse_pos):
+        current_tab = self.current_tab
+        if current_tab == ShopTab.ENCLOSURES:
+            # select an enclosure to place, it sits on the first shop row
+            if self.shop_row_rects[0].collidepoint(mouse_pos):
                 price = self.calculate_enclosure_price()
                 if self.game.money >= price:
                     self.placement_mode = PlacementMode.ENCLOSURE
@@ -931,88 +1390,93 @@ class HUD:
                     self.shop_button.is_active = False
                     self.exit_mode_button.visible = True
         
-        elif self.current_tab == ShopTab.PROPS:
-            # props list with scroll
-            y_offset = content_y
-            
-            # calculate actual start index using virtual scrolling (same as draw_shop_content)
-            total_items = len(PROP_PRICES)
-            if total_items < self.virtual_total_slots:
-                max_virtual_scroll = self.virtual_total_slots - self.max_visible_items
-                if max_virtual_scroll > 0:
-                    scroll_ratio = min(1.0, self.scroll_offset / max_virtual_scroll)
-                    actual_start_index = scroll_ratio * (self.virtual_total_slots - self.max_visible_items)
-                else:
-                    actual_start_index = 0
-            else:
-                actual_start_index = self.scroll_offset
+        elif current_tab in SHOP_LIST_TABS:
+            # the rows form a regular column, so the clicked item is found with index math
+            items, mode = SHOP_LIST_TABS[current_tab]
+            index = self.shop_row_at(mouse_pos, len(items))
+            if index is None:
+                return
             
-            items_drawn = 0
-            for i, (prop_name, data) in enumerate(PROP_PRICES.items()):
-                # skip items before scroll offset
-                if i < int(actual_start_index):
-                    continue
-                # stop after max visible items
-                if items_drawn >= self.max_visible_items:
-                    break
-                
-                # calculate position for this visible item
-                item_y = y_offset + items_drawn * (item_height + item_spacing)
-                
-                prop_rect = pg.Rect(self.shop_rect.x + 115, item_y, self.shop_width - 230, item_height)
-                if prop_rect.collidepoint(mouse_pos):
-                    if self.game.money >= data["price"]:
-                        self.placement_mode = PlacementMode.PROP
-                        self.selected_item = prop_name
-                        self.shop_open = False
-                        self.shop_button.is_active = False
-                        self.exit_mode_button.visible = True
-                        return
-                
-                items_drawn += 1
+            item_name, _, price = items[index]
+            if self.game.money >= price:
+                self.placement_mode = mode
+                self.selected_item = item_name
+                self.shop_open = False
+                self.shop_button.is_active = False
+                self.exit_mode_button.visible = True
+
+    def get_shop_start_index(self, total_items: int) -> float:
+        """
+        index of the first visible item of a scrolled shop list (same as draw_shop_content)
         
-        elif self.current_tab == ShopTab.ANIMALS:
-            # animals list with scroll
-            y_offset = content_y
-            
-            # calculate actual start index using virtual scrolling (same as draw_shop_content)
-            total_items = len(ANIMAL_PRICES)
-            if total_items < self.virtual_total_slots:
-                max_virtual_scroll = self.virtual_total_slots - self.max_visible_items
-                if max_virtual_scroll > 0:
-                    scroll_ratio = min(1.0, self.scroll_offset / max_virtual_scroll)
-                    actual_start_index = scroll_ratio * (self.virtual_total_slots - self.max_visible_items)
-                else:
-                    actual_start_index = 0
+        args:
+            total_items: number of items in the current tab
+        
+        returns:
+            the start index, possibly fractional when virtual slots are used
+        """
+        # hover, clicks and drawing all ask for it, it only changes with the scroll
+        key = (total_items, self.scroll_offset)
+        if key == self._shop_start_key:
+            return self._shop_start_index
+        self._shop_start_key = key
+        
+        start_index = self.scroll_offset
+        if total_items < self.virtual_total_slots:
+            max_virtual_scroll = self.virtual_total_slots - self.max_visible_items
+            if max_virtual_scroll > 0:
+                scroll_ratio = min(1.0, self.scroll_offset / max_virtual_scroll)
+                start_index = scroll_ratio * (self.virtual_total_slots - self.max_visible_items)
             else:
-                actual_start_index = self.scroll_offset
-            
-            items_drawn = 0
-            for i, (animal_name, data) in enumerate(ANIMAL_PRICES.items()):
-                # skip items before scroll offset
-                if i < int(actual_start_index):
-                    continue
-                # stop after max visible items
-                if items_drawn >= self.max_visible_items:
-                    break
-                
-                # calculate position for this visible item
-                item_y = y_offset + items_drawn * (item_height + item_spacing)
-                
-                animal_rect = pg.Rect(self.shop_rect.x + 115, item_y, self.shop_width - 230, item_height)
-                if animal_rect.collidepoint(mouse_pos):
-                    if self.game.money >= data["price"]:
-                        self.placement_mode = PlacementMode.ANIMAL
-                        self.selected_item = animal_name
-                        self.shop_open = False
-                        self.shop_button.is_active = False
-                        self.exit_mode_button.visible = True
-                        return
-                
-                items_drawn += 1
+                start_index = 0
+        self._shop_start_index = start_index
+        return start_index
+
+    def shop_row_at(self, pos: Tuple[int, int], total_items: int) -> Optional[int]:
+        """
+        find the item of a scrolled shop list under a point
+        
+        args:
+            pos: point in screen coordinates
+            total_items: number of items in the current tab
+        
+        returns:
+            index of the item in the tab, or none if the point is not on a row
+        """
+        row = self.shop_visible_row_at(pos)
+        if row is None:
+            return None
+        index = int(self.get_shop_start_index(total_items)) + row
+        return index if index < total_items else None
+
+    def shop_visible_row_at(self, pos: Tuple[int, int]) -> Optional[int]:
+        """
+        find the visible shop row under a point, whatever the scroll
+        
+        args:
+            pos: point in screen coordinates
+        
+        returns:
+            index of the row on screen (0 is the top one), or none if the point is not on a row
+        """
+        x, y = pos
+        shop_x, shop_y = self.shop_rect.topleft
+        list_x = shop_x + 115
+        if not list_x <= x < list_x + self.shop_width - 230:
+            return None
+        
+        # row under the point, rejecting the spacing between rows
+        offset_y = y - (shop_y + SHOP_CONTENT_OFFSET)
+        row, row_y = divmod(offset_y, SHOP_ITEM_HEIGHT + SHOP_ITEM_SPACING)
+        if offset_y < 0 or row_y >= SHOP_ITEM_HEIGHT or row >= self.max_visible_items:
+            return None
+        return row
 
     def update(self):
         """update hud state"""
+        # apply a pending zoom or resize before anything is drawn with the new tile size
+        self.reload_textures()
+        
         # update shop rectangles if window was resized
         self.update_shop_rects()
         self.update_pause_menu_rects()
@@ -1026,100 +1490,103 @@ class HUD:
                 self.pause_quit_button.update(mouse_pos)
             return  # dont update rest of hud while paused
         
-        # update buttons (hover, etc)
+        # update bulldozer button price display dynamically, the label is only rebuilt when the cost changes
+        bulldozer_cost = self.calculate_bulldozer_cost()
+        if bulldozer_cost != self.bulldozer_cost_shown:
+            self.bulldozer_cost_shown = bulldozer_cost
+            self.bulldozer_button.clear_secondary_texts()
+            self.bulldozer_button.add_secondary_text(f"${bulldozer_cost}", MONEY_COLOR, 10)  # lowered by 25 total
+        
+        # hovers and placement checks only depend on this state, skip them while it stays the same
+        # money is part of it because every purchase or demolition changes the map and costs something
         mouse_pos = pg.mouse.get_pos()
-        for button in self.buttons:
-            button.update(mouse_pos)
+        game = self.game
+        camera = game.camera
+        shop_open = self.shop_open
+        placement_mode = self.placement_mode
+        signature = (mouse_pos, camera.x, camera.y, game.tile_size, game.current_res,
+                     shop_open, self.current_tab, self.scroll_offset, placement_mode,
+                     self.selected_item, self.enclosure_width, self.enclosure_height, int(game.money))
+        if signature == self.update_signature and not self.input_pending:
+            return
+        self.update_signature = signature
+        self.input_pending = False
         
-        # update bulldozer button price display dynamically
-        bulldozer_cost = self.calculate_bulldozer_cost()
-        self.bulldozer_button.clear_secondary_texts()
-        self.bulldozer_button.add_secondary_text(f"${bulldozer_cost}", (255, 215, 0), 10)  # lowered by 25 total
+        # update buttons (hover, etc), away from every button only a last pass to clear the hover is needed
+        if self.buttons_area.collidepoint(mouse_pos) or self.buttons_hovered:
+            for button in self.buttons:
+                button.update(mouse_pos)
+            self.buttons_hovered = self.buttons_area.collidepoint(mouse_pos)
         
         # update shop close button if shop is open
-        if self.shop_open and self.shop_close_button:
+        if shop_open and self.shop_close_button:
             self.shop_close_button.update(mouse_pos)
         
         # track hovered shop item
         self.hovered_shop_item_rect = None
         self.hovered_tab = None
-        if self.shop_open:
+        if shop_open:
             self.update_shop_item_hover(mouse_pos)
             self.update_tab_hover(mouse_pos)
         
-        if self.placement_mode != PlacementMode.NONE:
+        if placement_mode != PlacementMode.NONE:
             # get mouse position in world coordinates
-            world_x = mouse_pos[0] + self.game.camera.x
-            world_y = mouse_pos[1] + self.game.camera.y
-            tile_x = int(world_x // self.game.tile_size)
-            tile_y = int(world_y // self.game.tile_size)
+            world_x = mouse_pos[0] + camera.x
+            world_y = mouse_pos[1] + camera.y
+            tile_x = int(world_x // game.tile_size)
+            tile_y = int(world_y // game.tile_size)
             
             self.hover_pos = (tile_x, tile_y)
             
             # check if we can place the object
-            if self.placement_mode == PlacementMode.ENCLOSURE:
+            if placement_mode == PlacementMode.ENCLOSURE:
                 self.can_place = self.check_enclosure_placement(tile_x, tile_y)
-            elif self.placement_mode == PlacementMode.PROP:
+            elif placement_mode == PlacementMode.PROP:
                 self.can_place = self.check_prop_placement(tile_x, tile_y)
-            elif self.placement_mode == PlacementMode.ANIMAL:
+            elif placement_mode == PlacementMode.ANIMAL:
                 self.can_place = self.check_animal_placement(tile_x, tile_y)
-            elif self.placement_mode == PlacementMode.BULLDOZER:
+            elif placement_mode == PlacementMode.BULLDOZER:
                 self.can_place = self.check_bulldozer_target(tile_x, tile_y)
 
     def update_shop_item_hover(self, mouse_pos):
         """update which shop item is being hovered"""
-        content_y = self.shop_rect.y + 280  # changed from 180 to 280
-        item_height = 70  # increased from 45
-        item_spacing = 15
-        
-        if self.current_tab == ShopTab.ENCLOSURES:
-            enclosure_rect = pg.Rect(self.shop_rect.x + 115, content_y, self.shop_width - 230, item_height)  # reduced width by 60px
-            if enclosure_rect.collidepoint(mouse_pos):
-                self.hovered_shop_item_rect = enclosure_rect
-        
-        elif self.current_tab == ShopTab.PROPS:
-            y_offset = content_y
-            for prop_name, data in PROP_PRICES.items():
-                prop_rect = pg.Rect(self.shop_rect.x + 115, y_offset, self.shop_width - 230, item_height)  # reduced width by 60px
-                if prop_rect.collidepoint(mouse_pos):
-                    self.hovered_shop_item_rect = prop_rect
-                    break
-                y_offset += item_height + item_spacing
-        
-        elif self.current_tab == ShopTab.ANIMALS:
-            y_offset = content_y
-            for animal_name, data in ANIMAL_PRICES.items():
-                animal_rect = pg.Rect(self.shop_rect.x + 115, y_offset, self.shop_width - 230, item_height)  # reduced width by 60px
-                if animal_rect.collidepoint(mouse_pos):
-                    self.hovered_shop_item_rect = animal_rect
-                    break
-                y_offset += item_height + item_spacing
+        current_tab = self.current_tab
+        row_rects = self.shop_row_rects
+        if current_tab == ShopTab.ENCLOSURES:
+            if row_rects[0].collidepoint(mouse_pos):
+                self.hovered_shop_item_rect = row_rects[0]
+        
+        elif current_tab in SHOP_LIST_TABS:
+            # same index math as clicks, only the row actually drawn under the mouse is hovered
+            total_items = len(SHOP_LIST_TABS[current_tab][0])
+            row = self.shop_visible_row_at(mouse_pos)
+            if row is not None and int(self.get_shop_start_index(total_items)) + row < total_items:
+                self.hovered_shop_item_rect = row_rects[row]
 
     def update_tab_hover(self, mouse_pos):
         """update which tab is being hovered"""
-        self.hovered_tab = None
-        for tab, rect in self.tab_buttons.items():
-            if rect.collidepoint(mouse_pos):
-                self.hovered_tab = tab
-                break
+        self.hovered_tab = self.tab_at(mouse_pos)
+
+    def tab_at(self, pos: Tuple[int, int]) -> Optional[ShopTab]:
+        """
+        find the shop tab under a point, the rects are tested in one collidelist call
+        
+        args:
+            pos: point in screen coordinates
+        
+        returns:
+            the tab, or none if the point is not on a tab
+        """
+        self.mouse_probe.topleft = pos
+        index = self.mouse_probe.collidelist(self.tab_buttons)
+        return SHOP_TABS[index] if index >= 0 else None
 
     def check_enclosure_placement(self, x, y):
         """check if we can place an enclosure at this position"""
         # verify that all tiles are free (no prop and no existing enclosure)
-        for i in range(self.enclosure_width):
-            for j in range(self.enclosure_height):
-                tile = self.game.map.get_tile(x + i, y + j)
-                if not tile:
-                    self.placement_error = "Out of bounds"
-                    return False
-                if tile.prop:
-                    self.placement_error = "Area occupied by prop"
-                    return False
-                if tile.is_enclosure:
-                    self.placement_error = "Area occupied by enclosure"
-                    return False
-        self.placement_error = ""
-        return True
+        state = self.game.map.area_state(x, y, self.enclosure_width, self.enclosure_height)
+        self.placement_error = AREA_ERRORS[state]
+        return state == AreaState.FREE
 
     def check_prop_placement(self, x, y):
         """check if we can place a prop at this position"""
@@ -1127,22 +1594,11 @@ class HUD:
             self.placement_error = "No item selected"
             return False
         
+        # cant place on existing prop or enclosure
         size = PROPS_SIZES.get(self.selected_item, (1, 1))
-        for i in range(int(size[0])):
-            for j in range(int(size[1])):
-                tile = self.game.map.get_tile(x + i, y + j)
-                if not tile:
-                    self.placement_error = "Out of bounds"
-                    return False
-                # cant place on existing prop or enclosure
-                if tile.prop:
-                    self.placement_error = "Area occupied by prop"
-                    return False
-                if tile.is_enclosure:
-                    self.placement_error = "Area occupied by enclosure"
-                    return False
-        self.placement_error = ""
-        return True
+        state = self.game.map.area_state(x, y, int(size[0]), int(size[1]))
+        self.placement_error = AREA_ERRORS[state]
+        return state == AreaState.FREE
 
     def check_animal_placement(self, x, y):
         """check if we can place an animal at this position (in an enclosure)"""
@@ -1205,6 +1661,7 @@ class HUD:
             if self.game.money >= price:
                 self.game.map.create_prop(self.selected_item, x, y)
                 self.game.money -= price
+                self.game.recompute_income()
                 self.exit_placement_mode()  # use function to properly clean up
         
         elif self.placement_mode == PlacementMode.ANIMAL and self.selected_item:
@@ -1217,6 +1674,7 @@ class HUD:
                     animal = Animal(self.selected_item, x + 0.5, y + 0.5)
                     enclosure.add_animal(animal)
                     self.game.money -= price
+                    self.game.recompute_income()
                     self.exit_placement_mode()  # use function to properly clean up
 
     def bulldoze_item(self):
@@ -1243,36 +1701,24 @@ class HUD:
             if hasattr(prop, 'animals'):
                 prop.animals.clear()
             
-            # delete all enclosure tiles
-            for i in range(prop.width):
-                for j in range(prop.height):
-                    t = self.game.map.get_tile(prop.x + i, prop.y + j)
-                    if t:
-                        t.prop = None
-                        t.is_enclosure = False
-                        t.enclosure_type = None
-                        t.main_prop_tile = False
-            
-            # remove from enclosure list
-            if prop in self.game.map.enclosures:
-                self.game.map.enclosures.remove(prop)
+            # delete all enclosure tiles and remove it from the enclosure list
+            self.game.map.remove_enclosure(prop)
         else:
             # if its a normal prop
             self.game.map.remove_prop(prop)
         
-        # deduct cost
+        # deduct cost, still based on the income before the removal
         bulldozer_cost = self.calculate_bulldozer_cost()
         self.game.money -= bulldozer_cost
+        self.game.recompute_income()
 
     def calculate_bulldozer_cost(self):
-        """calculate bulldozer cost based on income per second"""
-        if hasattr(self.game, 'income_per_second') and self.game.income_per_second > 0:
-            return max(BULLDOZER_BASE_COST, int(min(self.game.income_per_second * 30, BULLDOZER_MAX_COST)))
-        return BULLDOZER_BASE_COST
+        """calculate bulldozer cost based on income per second (memoized on the income)"""
+        return bulldozer_cost(getattr(self.game, 'income_per_second', 0))
 
     def calculate_enclosure_price(self):
-        """calculate enclosure price based on its size"""
-        return ENCLOSURE_BASE_PRICE + (self.enclosure_width * self.enclosure_height * ENCLOSURE_COST_PER_TILE)
+        """calculate enclosure price based on its size (memoized on the size)"""
+        return enclosure_price(self.enclosure_width, self.enclosure_height)
 
     def draw(self):
         """draw the hud"""
@@ -1283,27 +1729,28 @@ class HUD:
             self.draw_pause_menu()
             return
         
-        # display money in top left
-        money_text = self.font.render(f"${int(self.game.money)}", True, (255, 215, 0))
-        self.game.screen.blit(money_text, (10, 10))
+        # display money in top left, only rendered again when the whole amount changes
+        money = int(self.game.money)
+        if money != self.money_shown:
+            self.money_shown = money
+            self.money_text = self.font.render(f"${money}", True, MONEY_COLOR)
+        self.game.screen.blit(self.money_text, (10, 10))
         
         # display income per second in top left
         if hasattr(self.game, 'income_per_second'):
-            income_text = self.small_font.render(f"+${self.game.income_per_second:.1f}/s", True, (100, 255, 100))
+            income_text = self.render_text(self.small_font, f"+${self.game.income_per_second:.1f}/s", INCOME_COLOR)
             self.game.screen.blit(income_text, (10, 50))
         
         # draw all generic buttons (except exit_mode_button which will be drawn after)
-        for button in self.buttons:
-            if button != self.exit_mode_button:
-                button.draw(self.game.screen)
+        self.draw_buttons([button for button in self.buttons if button != self.exit_mode_button])
         
         # display current speed - next to buttons in bottom left
-        speed_text = self.small_font.render(f"Camera Speed: {self.game.player.speed}", True, (255, 255, 255))
+        speed_text = self.render_text(self.small_font, f"Camera Speed: {self.game.player.speed}", (255, 255, 255))
         self.game.screen.blit(speed_text, (130, screen_height - 45))
         
         # display current zoom - next to buttons in bottom left
         zoom_label = self.get_zoom_label()
-        zoom_text = self.small_font.render(f"Zoom: {zoom_label}", True, (255, 255, 255))
+        zoom_text = self.render_text(self.small_font, f"Zoom: {zoom_label}", (255, 255, 255))
         self.game.screen.blit(zoom_text, (450, screen_height - 45))
         
         # display mode screen if in placement mode
@@ -1325,16 +1772,27 @@ class HUD:
             # display error message if placement is not valid
             if not self.can_place and self.placement_error:
                 screen_width = self.game.current_res[0]
-                error_text = self.medium_font.render(self.placement_error, True, (255, 50, 50))
+                error_text = self.render_text(self.medium_font, self.placement_error, ERROR_COLOR)
                 error_rect = error_text.get_rect(center=(screen_width // 2, 70))  # moved down from 50 to 70
                 
                 # no background, just transparent red text
                 self.game.screen.blit(error_text, error_rect)
     
+    def draw_buttons(self, buttons: list):
+        """
+        draw several buttons with a single blits call
+        
+        args:
+            buttons: buttons to draw, in drawing order
+        """
+        blits = []
+        for button in buttons:
+            if button.visible:
+                blits.extend(button.get_blits())
+        blit_batch(self.game.screen, blits)
+    
     def draw_mode_screen(self):
         """draw screen corresponding to current mode"""
-        screen_width, screen_height = self.game.current_res
-        
         # choose appropriate image
         mode_img = None
         if self.placement_mode == PlacementMode.ENCLOSURE or self.placement_mode == PlacementMode.PROP:
@@ -1346,264 +1804,156 @@ class HUD:
         
         if mode_img:
             # center image at top of screen
-            img_width = mode_img.get_width()
-            x = (screen_width - img_width) // 2
-            y = 0
-            self.game.screen.blit(mode_img, (x, y))
+            self.game.screen.blit(mode_img, (self.mode_img_x, 0))
 
     def draw_shop(self):
         """draw the shop window"""
-        # shop background with image (no border)
-        self.game.screen.blit(self.shop_bg_img, self.shop_rect.topleft)
+        # the whole panel is collected and drawn with a single batched call
+        # shop background with the tabs, composed once per tab state
+        blits = [(self.get_shop_chrome(), self.shop_rect.topleft)]
         
         # close button with hover
-        if self.shop_close_button:
-            self.shop_close_button.draw(self.game.screen)
+        if self.shop_close_button and self.shop_close_button.visible:
+            blits += self.shop_close_button.get_blits()
+        
+        # tab content
+        self.draw_shop_content(blits)
+        blit_batch(self.game.screen, blits)
+
+    def get_shop_chrome(self) -> pg.Surface:
+        """
+        get the shop background with the tab buttons and their labels drawn on it
+        the surface is rebuilt only when the active or hovered tab changes
+        
+        returns:
+            surface of the shop size, to draw at the shop position
+        """
+        key = (self.current_tab, self.hovered_tab)
+        if key == self._shop_chrome_key and self._shop_chrome:
+            return self._shop_chrome
+        
+        chrome = self.shop_bg_img.copy()
+        shop_x, shop_y = self.shop_rect.topleft
         
         # tabs with button images
-        for tab, rect in self.tab_buttons.items():
+        for tab, rect in zip(SHOP_TABS, self.tab_buttons):
             # choose the appropriate button image based on state
             if tab == self.current_tab:
                 # active state - use activated image
-                tab_img = pg.transform.scale(self.shop_item_btn_active, (rect.width, rect.height))
+                tab_img = self.scaled(self.shop_item_btn_active, (rect.width, rect.height))
             elif tab == self.hovered_tab:
                 # hover state - use hover image
-                tab_img = pg.transform.scale(self.shop_item_btn_hover, (rect.width, rect.height))
+                tab_img = self.scaled(self.shop_item_btn_hover, (rect.width, rect.height))
             else:
                 # normal state - use normal image
-                tab_img = pg.transform.scale(self.shop_item_btn_img, (rect.width, rect.height))
+                tab_img = self.scaled(self.shop_item_btn_img, (rect.width, rect.height))
             
-            self.game.screen.blit(tab_img, rect.topleft)
+            tab_rect = rect.move(-shop_x, -shop_y)
+            chrome.blit(tab_img, tab_rect.topleft)
             
-            tab_names = {
-                ShopTab.ENCLOSURES: "ENCLOS",  # translated from "ENCLOS"
-                ShopTab.PROPS: "PROPS",
-                ShopTab.ANIMALS: "ANIMALS"  # translated from "ANIMAUX"
-            }
-            tab_text = self.medium_font.render(tab_names[tab], True, (255, 255, 255))
-            text_rect = tab_text.get_rect(center=rect.center)
-            self.game.screen.blit(tab_text, text_rect)
+            tab_text = self.tab_labels[tab.value]
+            text_rect = tab_text.get_rect(center=tab_rect.center)
+            chrome.blit(tab_text, text_rect)
         
-        # tab content
-        self.draw_shop_content()
+        self._shop_chrome = chrome
+        self._shop_chrome_key = key
+        return chrome
 
-    def draw_shop_content(self):
-        """draw current tab content"""
-        content_y = self.shop_rect.y + 280  # changed from 180 to 280 (moved down 100px)
-        item_height = 70  # increased from 45
-        item_spacing = 15  # reduced from 20
-        
-        if self.current_tab == ShopTab.ENCLOSURES:
-            # enclosures
-            price = self.calculate_enclosure_price()
-            item_rect = pg.Rect(self.shop_rect.x + 115, content_y, self.shop_width - 230, item_height)  # reduced width by 60px
-            
-            # draw solid color background
-            item_surface = pg.Surface((item_rect.width, item_rect.height))
-            item_surface.set_alpha(180)
-            color = (80, 150, 80) if self.game.money >= price else (150, 80, 80)
-            item_surface.fill(color)
-            self.game.screen.blit(item_surface, item_rect.topleft)
-            pg.draw.rect(self.game.screen, (200, 200, 150), item_rect, 2)
-            
-            # draw enclosure image preview
-            image_size = 60  # increased from 40
-            if self.enclosure_image:
-                enc_img = pg.transform.scale(self.enclosure_image, (image_size, image_size))
-                self.game.screen.blit(enc_img, (item_rect.left + 5, item_rect.top + (item_height - image_size) // 2))
-            
-            # text (offset to make room for image)
-            text_offset = image_size + 15
-            name_text = self.medium_font.render(f"Enclosure {self.enclosure_width}x{self.enclosure_height}", True, (255, 255, 230))
-            price_text = self.medium_font.render(f"${price}", True, (255, 215, 100))
-            info_text = self.small_font.render("Click to buy and place", True, (230, 230, 200))
-            
-            self.game.screen.blit(name_text, (item_rect.left + text_offset, item_rect.top + 10))
-            self.game.screen.blit(price_text, (item_rect.right - price_text.get_width() - 15, item_rect.top + 10))
-            self.game.screen.blit(info_text, (item_rect.left + text_offset, item_rect.top + 40))  # more spacing  # adjusted from 35
-            
-            # size controls
-            controls_y = content_y + 100  # moved down from 80
-            
-            # calculate center position for the entire size selector
-            selector_width = self.shop_width - 230  # match item width (reduced by 60px)
-            selector_start_x = self.shop_rect.x + 115  # match item x position (increased by 30px)
-            
-            # width (x) - label on the left, shifted 100px right
-            width_label = self.medium_font.render("Width:", True, (0, 0, 0))  # changed to black
-            width_label_x = self.enclosure_width_minus_rect.left - width_label.get_width() - 10 + 100
-            self.game.screen.blit(width_label, (width_label_x, controls_y - 30))
-            
-            # button - with image
-            self.game.screen.blit(self.minus_img, self.enclosure_width_minus_rect.topleft)
-            
-            # value
-            width_value = self.font.render(f"{self.enclosure_width}", True, (0, 0, 0))  # changed to black
-            width_value_x = (self.enclosure_width_minus_rect.right + self.enclosure_width_plus_rect.left) // 2
-            width_value_rect = width_value.get_rect(center=(width_value_x, self.enclosure_width_minus_rect.centery))
-            self.game.screen.blit(width_value, width_value_rect)
-            
-            # button + with image
-            self.game.screen.blit(self.plus_img, self.enclosure_width_plus_rect.topleft)
-            
-            # height (y) - label on the left, shifted 100px right
-            height_label = self.medium_font.render("Height:", True, (0, 0, 0))  # changed to black
-            height_label_x = self.enclosure_height_minus_rect.left - height_label.get_width() - 10 + 100
-            self.game.screen.blit(height_label, (height_label_x, controls_y - 30))
-            
-            # button - with image
-            self.game.screen.blit(self.minus_img, self.enclosure_height_minus_rect.topleft)
-            
-            # value
-            height_value = self.font.render(f"{self.enclosure_height}", True, (0, 0, 0))  # changed to black
-            height_value_x = (self.enclosure_height_minus_rect.right + self.enclosure_height_plus_rect.left) // 2
-            height_value_rect = height_value.get_rect(center=(height_value_x, self.enclosure_height_minus_rect.centery))
-            self.game.screen.blit(height_value, height_value_rect)
-            
-            # button + with image
-            self.game.screen.blit(self.plus_img, self.enclosure_height_plus_rect.topleft)
+    def draw_shop_content(self, blits: list):
+        """
+        draw current tab content
         
-        elif self.current_tab == ShopTab.PROPS:
-            y_offset = content_y
-            
-            # calculate actual start index using virtual scrolling
-            total_items = len(PROP_PRICES)
-            if total_items < self.virtual_total_slots:
-                # use virtual slots for smooth scrolling with empty space at bottom
-                # map scroll_offset (0 to 46 for 50 slots) to allow scrolling past items
-                max_virtual_scroll = self.virtual_total_slots - self.max_visible_items  # 46 for 50 slots
-                if max_virtual_scroll > 0:
-                    # normalize scroll position (0.0 to 1.0)
-                    scroll_ratio = min(1.0, self.scroll_offset / max_virtual_scroll)
-                    # allow scrolling to show empty space - go beyond total_items
-                    # with 8 items and 50 virtual slots, we can scroll much further
-                    actual_start_index = scroll_ratio * (self.virtual_total_slots - self.max_visible_items)
-                else:
-                    actual_start_index = 0
-            else:
-                actual_start_index = self.scroll_offset
-            
-            # draw only visible items based on scroll
-            items_drawn = 0
-            for i, (prop_name, data) in enumerate(PROP_PRICES.items()):
-                # skip items before scroll offset (using float comparison for smooth scroll)
-                if i < int(actual_start_index):
-                    continue
-                # stop rendering after max visible items or if we've drawn enough
-                if items_drawn >= self.max_visible_items:
-                    break
-                
-                # calculate position for this visible item
-                item_y = y_offset + items_drawn * (item_height + item_spacing)
-                
-                item_rect = pg.Rect(self.shop_rect.x + 115, item_y, self.shop_width - 230, item_height)
-                
-                price = data["price"]
-                income = data["income"]
-                
-                # draw solid color background
-                item_surface = pg.Surface((item_rect.width, item_rect.height))
-                item_surface.set_alpha(180)
-                color = (80, 150, 80) if self.game.money >= price else (150, 80, 80)
-                item_surface.fill(color)
-                self.game.screen.blit(item_surface, item_rect.topleft)
-                pg.draw.rect(self.game.screen, (200, 200, 150), item_rect, 2)
-                
-                # draw prop image preview
-                image_size = 60  # increased from 40
-                prop_img = self.game.renderer.get_prop_texture(prop_name)
-                if prop_img:
-                    prop_img_scaled = pg.transform.scale(prop_img, (image_size, image_size))
-                    self.game.screen.blit(prop_img_scaled, (item_rect.left + 5, item_rect.top + (item_height - image_size) // 2))
-                
-                # text (offset to make room for image)
-                text_offset = image_size + 15
-                name_text = self.medium_font.render(prop_name.capitalize(), True, (255, 255, 230))
-                price_text = self.medium_font.render(f"${price}", True, (255, 215, 100))
-                size = PROPS_SIZES.get(prop_name, (1, 1))
-                income_text = self.small_font.render(f"+${income}/s | Size: {int(size[0])}x{int(size[1])}", True, (230, 230, 200))
-                
-                self.game.screen.blit(name_text, (item_rect.left + text_offset, item_rect.top + 10))
-                self.game.screen.blit(price_text, (item_rect.right - price_text.get_width() - 15, item_rect.top + 10))
-                self.game.screen.blit(income_text, (item_rect.left + text_offset, item_rect.top + 40))  # shows income + size
-                
-                items_drawn += 1
-            
-            # draw scrollbar
-            self.draw_scrollbar()
+        args:
+            blits: list of (surface, position) pairs the content is appended to, drawn by draw_shop()
+        """
+        # each tab has its own drawer, see tab_drawers
+        self.tab_drawers[self.current_tab](blits)
+    
+    def draw_enclosure_tab(self, blits: list):
+        """
+        draw the enclosure item and its size selector
         
-        elif self.current_tab == ShopTab.ANIMALS:
-            y_offset = content_y
-            
-            # calculate actual start index using virtual scrolling
-            total_items = len(ANIMAL_PRICES)
-            if total_items < self.virtual_total_slots:
-                # use virtual slots for smooth scrolling with empty space at bottom
-                # map scroll_offset (0 to 46 for 50 slots) to allow scrolling past items
-                max_virtual_scroll = self.virtual_total_slots - self.max_visible_items  # 46 for 50 slots
-                if max_virtual_scroll > 0:
-                    # normalize scroll position (0.0 to 1.0)
-                    scroll_ratio = min(1.0, self.scroll_offset / max_virtual_scroll)
-                    # allow scrolling to show empty space - go beyond total_items
-                    # with 8 items and 50 virtual slots, we can scroll much further
-                    actual_start_index = scroll_ratio * (self.virtual_total_slots - self.max_visible_items)
-                else:
-                    actual_start_index = 0
-            else:
-                actual_start_index = self.scroll_offset
-            
-            # draw only visible items based on scroll
-            items_drawn = 0
-            for i, (animal_name, data) in enumerate(ANIMAL_PRICES.items()):
-                # skip items before scroll offset (using float comparison for smooth scroll)
-                if i < int(actual_start_index):
-                    continue
-                # stop rendering after max visible items or if we've drawn enough
-                if items_drawn >= self.max_visible_items:
-                    break
-                
-                # calculate position for this visible item
-                item_y = y_offset + items_drawn * (item_height + item_spacing)
-                
-                item_rect = pg.Rect(self.shop_rect.x + 115, item_y, self.shop_width - 230, item_height)
-                
-                # draw solid color background
-                item_surface = pg.Surface((item_rect.width, item_rect.height))
-                item_surface.set_alpha(180)
-                color = (80, 150, 80) if self.game.money >= data['price'] else (150, 80, 80)
-                item_surface.fill(color)
-                self.game.screen.blit(item_surface, item_rect.topleft)
-                pg.draw.rect(self.game.screen, (200, 200, 150), item_rect, 2)
-                
-                # draw animal image preview
-                image_size = 60  # increased from 40
-                # get first frame of idle south animation from renderer
-                animal_img = self.game.renderer.get_animal_frame(animal_name, 'idle', Direction.SOUTH, 0)
-                if animal_img:
-                    animal_img_scaled = pg.transform.scale(animal_img, (image_size, image_size))
-                    self.game.screen.blit(animal_img_scaled, (item_rect.left + 5, item_rect.top + (item_height - image_size) // 2))
-                
-                # text (offset to make room for image)
-                text_offset = image_size + 15
-                name_text = self.medium_font.render(animal_name.capitalize(), True, (255, 255, 230))
-                price_text = self.medium_font.render(f"${data['price']}", True, (255, 215, 100))
-                income_text = self.small_font.render(f"Income: +${data['income']}/s", True, (150, 255, 150))
-                
-                self.game.screen.blit(name_text, (item_rect.left + text_offset, item_rect.top + 10))
-                self.game.screen.blit(price_text, (item_rect.right - price_text.get_width() - 15, item_rect.top + 10))
-                self.game.screen.blit(income_text, (item_rect.left + text_offset, item_rect.top + 40))  # more spacing  # adjusted from 35
-                
-                items_drawn += 1
-            
-            # draw scrollbar
-            self.draw_scrollbar()
+        args:
+            blits: list of (surface, position) pairs the content is appended to
+        """
+        content_y = self.shop_rect.y + SHOP_CONTENT_OFFSET
+        
+        # enclosures
+        price = self.calculate_enclosure_price()
+        name = f"Enclosure {self.enclosure_width}x{self.enclosure_height}"
+        
+        # background, preview and texts come composed on one surface
+        blits.append((self.get_shop_row(ShopTab.ENCLOSURES, name, None, price, self.game.money >= price), self.shop_row_rects[0].topleft))
+        
+        # size controls
+        controls_y = content_y + 100  # moved down from 80
+        
+        # width (x) - label on the left, shifted 100px right
+        width_label = self.width_label  # changed to black
+        width_label_x = self.enclosure_width_minus_rect.left - width_label.get_width() - 10 + 100
+        blits.append((width_label, (width_label_x, controls_y - 30)))
+        
+        # button - with image
+        blits.append((self.minus_img, self.enclosure_width_minus_rect.topleft))
+        
+        # value
+        width_value = self.size_value_texts[self.enclosure_width]  # changed to black
+        width_value_x = (self.enclosure_width_minus_rect.right + self.enclosure_width_plus_rect.left) // 2
+        width_value_rect = width_value.get_rect(center=(width_value_x, self.enclosure_width_minus_rect.centery))
+        blits.append((width_value, width_value_rect.topleft))
+        
+        # button + with image
+        blits.append((self.plus_img, self.enclosure_width_plus_rect.topleft))
+        
+        # height (y) - label on the left, shifted 100px right
+        height_label = self.height_label  # changed to black
+        height_label_x = self.enclosure_height_minus_rect.left - height_label.get_width() - 10 + 100
+        blits.append((height_label, (height_label_x, controls_y - 30)))
+        
+        # button - with image
+        blits.append((self.minus_img, self.enclosure_height_minus_rect.topleft))
+        
+        # value
+        height_value = self.size_value_texts[self.enclosure_height]  # changed to black
+        height_value_x = (self.enclosure_height_minus_rect.right + self.enclosure_height_plus_rect.left) // 2
+        height_value_rect = height_value.get_rect(center=(height_value_x, self.enclosure_height_minus_rect.centery))
+        blits.append((height_value, height_value_rect.topleft))
+        
+        # button + with image
+        blits.append((self.plus_img, self.enclosure_height_plus_rect.topleft))
     
-    def draw_scrollbar(self):
-        """draw the scrollbar for props and animals tabs"""
-        if self.current_tab not in [ShopTab.PROPS, ShopTab.ANIMALS]:
-            return
+    def draw_item_list_tab(self, blits: list):
+        """
+        draw the visible rows of a scrolled item list (props and animals tabs) and its scrollbar
         
-        total_items = self.get_total_items_for_tab()
+        args:
+            blits: list of (surface, position) pairs the content is appended to
+        """
+        # props and animals, both scrolled lists of (name, data, price)
+        current_tab = self.current_tab
+        items = SHOP_LIST_TABS[current_tab][0]
+        
+        # start index using virtual scrolling, possibly past the last item
+        start_index = int(self.get_shop_start_index(len(items)))
+        
+        # draw only visible items based on scroll
+        money = self.game.money
+        for item_rect, (name, data, price) in zip(self.shop_row_rects, items[start_index:start_index + self.max_visible_items]):
+            # one composed surface per row, see get_shop_row()
+            blits.append((self.get_shop_row(current_tab, name, data, price, money >= price), item_rect.topleft))
+        
+        # draw scrollbar
+        self.draw_scrollbar(blits)
+    
+    def draw_scrollbar(self, blits: list):
+        """
+        draw the scrollbar for props and animals tabs
+        
+        args:
+            blits: list of (surface, position) pairs the scrollbar is appended to
+        """
+        if self.current_tab not in SHOP_LIST_TABS:
+            return
         
         # always show scrollbar if using virtual slots (even if items <= max_visible)
         # this ensures smooth scrolling even with few items
@@ -1611,36 +1961,28 @@ class HUD:
         if effective_range <= 0:
             return  # no scrolling needed
         
-        # position scrollbar on the right side of shop content (moved 3px right from -115)
-        content_y = self.shop_rect.y + 280
-        scrollbar_x = self.shop_rect.x + self.shop_width - 112  # moved 3px right from -115
-        scrollbar_y = content_y
-        
-        # calculate scrollbar height based on visible area
-        item_height = 70
-        item_spacing = 15
-        visible_area_height = self.max_visible_items * (item_height + item_spacing) - item_spacing
-        scrollbar_height = min(400, visible_area_height)
+        # scrollbar on the right side of shop content, placed by update_shop_rects()
+        scrollbar_x, scrollbar_y = self.scroll_bar_rect.topleft
+        scrollbar_height = self.scrollbar_height
         
         # draw scrollbar background
-        scroll_bg = pg.transform.scale(self.scroll_bg_img, (30, scrollbar_height))
-        self.game.screen.blit(scroll_bg, (scrollbar_x, scrollbar_y))
-        self.scroll_bar_rect = pg.Rect(scrollbar_x, scrollbar_y, 30, scrollbar_height)
+        blits.append((self.scroll_bg_img, (scrollbar_x, scrollbar_y)))
         
         # calculate cursor position using effective scroll range (virtual slots)
         max_scroll = effective_range
         if max_scroll > 0:
             scroll_ratio = self.scroll_offset / max_scroll
-            cursor_height = self.scroll_cursor_img.get_height()
+            cursor_height = self.scroll_cursor_height
             max_cursor_y = scrollbar_height - cursor_height
             cursor_y = scrollbar_y + int(scroll_ratio * max_cursor_y)
         else:
             cursor_y = scrollbar_y
         
         # draw scrollbar cursor (square, 1px left = 2px more to right from original -3)
+        # the cursor rect is moved in place, no new rect every frame
         cursor_x = scrollbar_x - 1
-        self.game.screen.blit(self.scroll_cursor_img, (cursor_x, cursor_y))
-        self.scroll_cursor_rect = pg.Rect(cursor_x, cursor_y, 30, self.scroll_cursor_img.get_height())
+        blits.append((self.scroll_cursor_img, (cursor_x, cursor_y)))
+        self.scroll_cursor_rect.update(cursor_x, cursor_y, 30, self.scroll_cursor_height)
 
     def draw_placement_hover(self):
         """draw placement preview"""
@@ -1658,33 +2000,11 @@ class HUD:
                 
                 if prop.is_enclosure:
                     # highlight entire enclosure
-                    for i in range(prop.width):
-                        for j in range(prop.height):
-                            world_x = (prop.x + i) * self.game.tile_size
-                            world_y = (prop.y + j) * self.game.tile_size
-                            screen_x, screen_y = self.game.camera.apply((world_x, world_y))
-                            
-                            hover_surface = pg.Surface((self.game.tile_size, self.game.tile_size))
-                            hover_surface.set_alpha(color[3])
-                            hover_surface.fill(color[:3])
-                            self.game.screen.blit(hover_surface, (screen_x, screen_y))
-                            pg.draw.rect(self.game.screen, color[:3], 
-                                       (screen_x, screen_y, self.game.tile_size, self.game.tile_size), 2)
+                    self.draw_tile_area(prop.x, prop.y, prop.width, prop.height, color)
                 else:
                     # highlight the prop
                     size = PROPS_SIZES.get(prop.name, (1, 1))
-                    for i in range(int(size[0])):
-                        for j in range(int(size[1])):
-                            world_x = (prop.x + i) * self.game.tile_size
-                            world_y = (prop.y + j) * self.game.tile_size
-                            screen_x, screen_y = self.game.camera.apply((world_x, world_y))
-                            
-                            hover_surface = pg.Surface((self.game.tile_size, self.game.tile_size))
-                            hover_surface.set_alpha(color[3])
-                            hover_surface.fill(color[:3])
-                            self.game.screen.blit(hover_surface, (screen_x, screen_y))
-                            pg.draw.rect(self.game.screen, color[:3], 
-                                       (screen_x, screen_y, self.game.tile_size, self.game.tile_size), 2)
+                    self.draw_tile_area(prop.x, prop.y, int(size[0]), int(size[1]), color)
             return
         
         color = (0, 255, 0, 100) if self.can_place else (255, 0, 0, 100)
@@ -1697,32 +2017,49 @@ class HUD:
             width, height = 1, 1
         
         # draw highlighted tiles
-        for i in range(int(width)):
-            for j in range(int(height)):
-                world_x = (x + i) * self.game.tile_size
-                world_y = (y + j) * self.game.tile_size
-                screen_x, screen_y = self.game.camera.apply((world_x, world_y))
-                
-                # semi-transparent surface
-                hover_surface = pg.Surface((self.game.tile_size, self.game.tile_size))
-                hover_surface.set_alpha(color[3])
-                hover_surface.fill(color[:3])
-                self.game.screen.blit(hover_surface, (screen_x, screen_y))
-                
-                # border
-                pg.draw.rect(self.game.screen, color[:3], 
-                           (screen_x, screen_y, self.game.tile_size, self.game.tile_size), 2)
+        self.draw_tile_area(x, y, int(width), int(height), color)
+    
+    def draw_tile_area(self, x: int, y: int, width: int, height: int, color: Tuple[int, int, int, int]):
+        """
+        highlight a block of tiles with a semi-transparent color and a border around every tile
+        the whole block is one blit, the borders are drawn per row and column instead of per tile
+        
+        args:
+            x, y: top left tile of the block
+            width, height: size of the block in tiles
+            color: rgba color of the highlight
+        """
+        tile_size = self.game.tile_size
+        screen = self.game.screen
+        left, top = self.game.camera.apply((x * tile_size, y * tile_size))
+        area = pg.Rect(left, top, width * tile_size, height * tile_size)
+        
+        # semi-transparent surface, only the part of the block inside the window is blitted
+        visible = area.clip(screen.get_rect())
+        if visible:
+            screen.blit(self.get_overlay_surface(color), visible.topleft, (0, 0, visible.width, visible.height))
+        
+        # border, 2px around the block and 4px where two tiles meet (2px from each tile)
+        rgb = color[:3]
+        pg.draw.rect(screen, rgb, area, 2)
+        for i in range(1, width):
+            pg.draw.rect(screen, rgb, (left + i * tile_size - 2, top, 4, area.height))
+        for j in range(1, height):
+            pg.draw.rect(screen, rgb, (left, top + j * tile_size - 2, area.width, 4))
     
     def draw_pause_menu(self):
         """draw pause menu"""
-        # semi-transparent background to darken screen
-        overlay = pg.Surface(self.game.current_res)
-        overlay.set_alpha(150)
-        overlay.fill((0, 0, 0))
-        self.game.screen.blit(overlay, (0, 0))
-        
-        # pause menu background with image
-        self.game.screen.blit(self.pause_bg_img, self.pause_rect.topleft)
+        if self.pause_backdrop is None:
+            # semi-transparent background to darken screen
+            self.game.screen.blit(self.get_overlay_surface((0, 0, 0, 150)), (0, 0))
+            
+            # pause menu background with image
+            self.game.screen.blit(self.pause_bg_img, self.pause_rect.topleft)
+            
+            # the world is frozen while paused, keep the darkened frame and panel for the next redraws
+            self.pause_backdrop = self.game.screen.copy()
+        else:
+            self.game.screen.blit(self.pause_backdrop, (0, 0))
         
         # draw pause menu buttons
         if self.pause_play_button:
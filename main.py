@@ -3,7 +3,7 @@ import pygame as pg
 import sys
 
 from render import *
-from camera import *
+from camera import Camera
 from map import *
 from player import *
 from config import STARTING_MONEY, ANIMAL_PRICES, PROP_PRICES
@@ -32,6 +32,8 @@ class Game:
         self.half_height = self.current_res[1] // 2
         self.tile_size = TILE_SIZE
         self.paused = False
+        self.paused_frame_shown = False  # true once a full frame has been flipped while paused
+        self.frame_drawn = True  # false when draw() kept the frame already on screen
         self.in_menu = True
         self.game_initialized = False
         
@@ -58,6 +60,8 @@ class Game:
             self.money = STARTING_MONEY
             self.renderer = Renderer(self)
             self.map = Map(self)
+            # the generated map can already hold props with an income
+            self.recompute_income()
             # place player at center of map (map is 70x50 tiles)
             map_center_x = len(self.map.map[0]) // 2  # 70 // 2 = 35
             map_center_y = len(self.map.map) // 2      # 50 // 2 = 25
@@ -86,7 +90,7 @@ class Game:
             self.hud.update()
             return
         
-        # calculate income per second based on animals and props
+        # add the income earned since the last frame
         self.calculate_income()
         
         self.player.update()
@@ -98,24 +102,39 @@ class Game:
 
     def draw(self):
         """render all game elements to screen"""
+        # while paused the world is frozen, the frame on screen stays valid until a pause button changes
+        self.frame_drawn = not (self.paused_frame_shown and self.paused and self.hud.pause_menu_open
+                                and not self.hud.pause_menu_changed())
+        if not self.frame_drawn:
+            return
+        
         self.screen.fill('black')
         
         if not self.game_initialized:
             return
             
-        self.map.draw()
-        self.player.draw()
+        # while paused the world is frozen and already part of the pause backdrop
+        if not (self.paused and self.hud.pause_backdrop is not None):
+            self.map.draw()
+            self.player.draw()
         self.hud.draw()
     
     def calculate_income(self):
         """
-        calculate and add income based on animals and props
-        iterates through all enclosurs and their animals to sum up total income per second
+        add income based on animals and props
+        the income per second only changes when something is bought or bulldozed, see recompute_income()
+        """
+        self.money += self.income_per_second * self.delta_time
+    
+    def recompute_income(self):
+        """
+        sum up the income per second of all animals and props
+        iterates through all enclosurs and their animals, called whenever a prop or animal is added or removed
         """
         total_income_per_second = 0
         
         # loop through all enclosures and thier animals
-        for enclosure in self.map.enclosures:
+        for enclosure in self.map.enclosures.values():
             for animal in enclosure.animals:
                 # add income from this animal
                 if animal.species in ANIMAL_PRICES:
@@ -126,8 +145,6 @@ class Game:
             if prop.name in PROP_PRICES:
                 total_income_per_second += PROP_PRICES[prop.name]["income"]
         
-        # add money based on elapsed time
-        self.money += total_income_per_second * self.delta_time
         self.income_per_second = total_income_per_second
 
     def check_event(self):
@@ -146,10 +163,29 @@ class Game:
                 self.half_height = self.current_res[1] // 2
                 # update button positions in hud
                 self.hud.handle_resize()
+                # the whole window has to be sent again after a resize
+                self.paused_frame_shown = False
+            elif event.type == pg.WINDOWEXPOSED:
+                # the window was uncovered, send the whole frame again
+                self.paused_frame_shown = False
             
             # pass event to hud for button handeling
             self.hud.handle_event(event)
     
+    def present(self):
+        """
+        send the drawn frame to the window
+        while paused the world is frozen, so once a full frame has been shown
+        only the pause menu area is updated, and only when a button changed its look
+        """
+        if self.paused and self.hud.pause_menu_open and self.paused_frame_shown:
+            if self.frame_drawn:
+                hud = self.hud
+                pg.display.update(hud.pause_rect.unionall([hud.pause_play_button.rect, hud.pause_quit_button.rect]))
+        else:
+            pg.display.flip()
+            self.paused_frame_shown = self.paused and self.hud.pause_menu_open
+    
     def return_to_menu(self):
         """return to main menu and reset game state"""
         self.in_menu = True
@@ -183,7 +219,7 @@ class Game:
                 self.check_event()
                 self.update()
                 self.draw()
-                pg.display.flip()
+                self.present()
 
 
 if __name__ == '__main__':
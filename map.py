@@ -1,10 +1,22 @@
 from __future__ import annotations
 import pygame as pg
-from random import choice
+from random import choice, randrange
 
 from config import PROP_PRICES
 from utils import *
-from enclosure import *
+from enclosure import Enclosure
+
+# every orientation in declaration order, indexed directly when picking a random one
+_DIRS = tuple(Direction)
+# area states indexed by their value, turns an occupancy byte back into the enum
+AREA_STATES = tuple(AreaState)
+
+# seconds between animal updates for enclosures outside the camera view
+OFFSCREEN_UPDATE_INTERVAL = 0.25
+
+# largest ground layer (in pixels) that gets pre-rendered on a single surface
+# 70x50 tiles at 64px is about 57mb, bigger zoom levels fall back to per tile blits
+BACKGROUND_MAX_PIXELS = 4480 * 3200
 
 
 class Map:
@@ -22,7 +34,15 @@ class Map:
         """
         self.game = game
         self.props = []  # list of all decorative props on the map
-        self.enclosures = []  # list of all animal enclosures
+        self.enclosures = {}  # all animal enclosures keyed by their top left tile, in placement order
+        self.background = None  # pre-rendered ground layer, see get_background
+        self.background_key = None  # (tile_size, tiles) the background was built with
+        # scratch lists reused by every draw call instead of allocating new ones each frame
+        self._screen_props = []
+        self._tile_blits = []
+        # largest prop footprint in tiles, used to widen the draw culling window
+        self.prop_margin_x = max(int(size[0]) for size in self.game.renderer.props_sizes.values())
+        self.prop_margin_y = max(int(size[1]) for size in self.game.renderer.props_sizes.values())
         self.generate_map()  # create the base tile grid
         self.generate_random_props()  # populate with random decorations
         
@@ -34,17 +54,91 @@ class Map:
         args:
             delta_time: time elapsed since last frame in seconds
         """
+        view = self.game.camera.view_rect_tiles
         # loop through each enclosure and update its animals
-        for enclosure in self.enclosures:
-            enclosure.update_animals(delta_time)
+        for enclosure in self.enclosures.values():
+            if enclosure.tile_rect.colliderect(view):
+                # visible enclosures tick every frame, catching up on any time spent off screen
+                enclosure.update_animals(enclosure.pending_time + delta_time)
+                enclosure.pending_time = 0
+            else:
+                # nobody can see these animals, so they are simulated in coarser steps
+                enclosure.pending_time += delta_time
+                if enclosure.pending_time >= OFFSCREEN_UPDATE_INTERVAL:
+                    enclosure.update_animals(enclosure.pending_time)
+                    enclosure.pending_time = 0
 
     def get_tile(self, x, y):
         """
         safely retrieve a tile at given coordinates
         returns none if coordinates are out of bounds
         """
-        return self.map[y][x] if 0 <= x < len(self.map[0]) and 0 <= y < len(self.map) else None
+        return self.map[y][x] if 0 <= x < self.w and 0 <= y < self.h else None
     
+    def area_state(self, x, y, width, height):
+        """
+        find what blocks a rectangle of tiles, scanning column by column like a get_tile loop would
+        reads the occupancy rows, a free area is a few byte slices instead of a walk over tile objects
+        
+        args:
+            x: left tile of the area
+            y: top tile of the area
+            width: width of the area in tiles
+            height: height of the area in tiles
+        
+        returns:
+            the AreaState of the first blocking tile, AreaState.FREE if the whole area is free
+        """
+        if width <= 0 or height <= 0:
+            return AreaState.FREE
+        if x < 0 or y < 0:
+            return AreaState.OUT_OF_BOUNDS
+        right = x + width
+        bottom = y + height
+        rows = self.occupancy[y:bottom]
+        
+        if right <= self.w and bottom <= self.h:
+            # area inside the map, find the leftmost blocked column (top row first) with byte strips
+            state = AreaState.FREE
+            for row in rows:
+                # what is left after the free tiles starts at the first blocked one
+                blocked = row[x:right].lstrip(b'\0')
+                if blocked:
+                    right -= len(blocked)
+                    state = blocked[0]
+                    if right == x:
+                        break  # rows below cannot be blocked further left
+            return AREA_STATES[state]
+        
+        # area crossing the edge of the map, scan column by column
+        for i in range(x, right):
+            if i >= self.w:
+                return AreaState.OUT_OF_BOUNDS
+            for row in rows:
+                if row[i]:
+                    return AREA_STATES[row[i]]
+            # the column goes past the bottom of the map
+            if bottom > self.h:
+                return AreaState.OUT_OF_BOUNDS
+        return AreaState.FREE
+    
+    def refresh_occupancy(self, x, y, width, height):
+        """
+        copy the state of a rectangle of tiles into the occupancy rows
+        called by everything that puts or removes a prop or an enclosure
+        
+        args:
+            x: left tile of the area
+            y: top tile of the area
+            width: width of the area in tiles
+            height: height of the area in tiles
+        """
+        for j in range(max(y, 0), min(y + height, self.h)):
+            row = self.map[j]
+            occupancy = self.occupancy[j]
+            for i in range(max(x, 0), min(x + width, self.w)):
+                tile = row[i]
+                occupancy[i] = AreaState.PROP if tile.prop else AreaState.ENCLOSURE if tile.is_enclosure else AreaState.FREE
 
     def generate_map(self):
         """
@@ -52,7 +146,13 @@ class Map:
         creates a 70x50 tile grid
         """
         # create 2d array with random tile textures (1 or 2) and random orientations
-        self.map = [[Tile(texture=randint(1,2), orientation=Direction(randint(0,3))) for _ in range(70)] for _ in range(50)]
+        self.map = [[Tile(texture=randint(1,2), orientation=_DIRS[randrange(4)]) for _ in range(70)] for _ in range(50)]
+        # map dimensions in tiles, cached for bounds checks
+        self.h = len(self.map)
+        self.w = len(self.map[0])
+        # AreaState of every tile, one bytearray per row, mirrors tile.prop / tile.is_enclosure
+        # so placement checks compare plain bytes instead of walking tile objects
+        self.occupancy = [bytearray(self.w) for _ in range(self.h)]
         
 
     def draw(self):
@@ -60,74 +160,155 @@ class Map:
         main rendering method for the entire map
         draws tiles, props, enclosures and animals in correct order for proper layering
         """
+        tile_size = self.game.tile_size
+        camera = self.game.camera
+        get_texture = self.game.renderer.get_texture
+        screen_width, screen_height = self.game.current_res
+        map_width, map_height = self.w, self.h
+
+        # visible window in tile indices, computed from the camera offset
+        # so we only walk the tiles that can actually end up on screen
+        i0 = max(0, int(camera.x // tile_size))
+        i1 = min(map_width, int((camera.x + screen_width) // tile_size) + 1)
+        j0 = max(0, int(camera.y // tile_size))
+        j1 = min(map_height, int((camera.y + screen_height) // tile_size) + 1)
+
+        # props are anchored on their top left tile, so the scan for them is
+        # widened by the biggest prop footprint to catch props entering from the left or top
+        pi0 = max(0, i0 - self.prop_margin_x)
+        pj0 = max(0, j0 - self.prop_margin_y)
+
+        # screen position of tile (0, 0), tiles are then offset by whole tile sizes
+        base_x = camera.ix
+        base_y = camera.iy
+
+        # the ground never changes, so when it fits in memory it is drawn with one blit
+        background = self.get_background()
+        if background is not None:
+            self.game.screen.blit(background, (base_x, base_y))
+
         # list to store props that need to be drawn on top of tiles
-        screen_props = []
-        
-        # iterate through all tiles in the map grid
-        for j in range(len(self.map)):
-            for i in range(len(self.map[0])):
-                tile = self.get_tile(i, j)
-                
-                # draw the base tile texture if it exists
-                if tile.texture :
-                    # convert tile coordinates to screen coordinates
-                    screen_x, screen_y = self.game.camera.apply((i * self.game.tile_size, j * self.game.tile_size))
-                    
-                    # only draw if tile is visible on screen (culling for performance)
-                    if -self.game.tile_size <= screen_x <= self.game.current_res[0] and -self.game.tile_size <= screen_y <= self.game.current_res[1]:
-                        self.game.screen.blit(self.game.renderer.get_texture(tile), (screen_x, screen_y))
-                
-                # collect enclosure tiles for later rendering
-                if tile.prop and tile.prop.is_enclosure and tile.enclosure_type is not None:
-                    screen_props.append((tile, i, j))
+        screen_props = self._screen_props
+        screen_props.clear()
+        # visible tiles are collected and sent to the screen in a single blits call
+        tile_blits = self._tile_blits
+        tile_blits.clear()
+
+        # slice the visible rows and columns once instead of indexing tile by tile
+        for j, row in enumerate(self.map[pj0:j1], pj0):
+            for i, tile in enumerate(row[pi0:i1], pi0):
+
+                # draw the base tile texture if it exists and is inside the view
+                if background is None and tile.texture and i >= i0 and j >= j0:
+                    tile_blits.append((get_texture(tile), (base_x + i * tile_size, base_y + j * tile_size)))
+
                 # collect main prop tiles (not enclosures) for later rendering
-                elif tile.prop and tile.main_prop_tile and not tile.prop.is_enclosure:
+                # enclosure fences are drawn per enclosure below
+                if tile.prop and tile.main_prop_tile and not tile.prop.is_enclosure:
                     screen_props.append((tile, i, j))
-        
+
+        # one c-level call for the whole ground layer instead of one blit per tile
+        self.game.screen.blits(tile_blits, doreturn=0)
+
+        # locals for the rest of the draw, avoids the attribute chains and
+        # camera.apply tuple round trips for every prop and animal
+        screen = self.game.screen
+        renderer = self.game.renderer
+        blit = screen.blit
+
         # draw all collected props on top of tiles
         for tile, i, j in screen_props:
-            if tile.prop.is_enclosure:
-                # render enclosure texture based on its type (corner, edge, etc)
-                enclosure_texture = self.game.renderer.enclosures_textures[tile.enclosure_type.value]
-                real_x, real_y = i * self.game.tile_size, j * self.game.tile_size
-                screen_x, screen_y = self.game.camera.apply((real_x, real_y))
-                self.game.screen.blit(enclosure_texture, (screen_x, screen_y))
-            else:
-                # render regular prop texture
-                prop_texture = self.game.renderer.get_prop_texture(tile.prop.name)
-                # convert tile coordinates to pixel coordinates
-                real_x = tile.prop.x * self.game.tile_size
-                real_y = tile.prop.y * self.game.tile_size
-                if prop_texture:
-                    screen_x, screen_y = self.game.camera.apply((real_x, real_y))
-                    self.game.screen.blit(prop_texture, (screen_x, screen_y))
+            # render regular prop texture
+            prop_texture = renderer.get_prop_texture(tile.prop.name)
+            if prop_texture:
+                # props are anchored on whole tiles so the offset stays integer
+                blit(prop_texture, (base_x + tile.prop.x * tile_size, base_y + tile.prop.y * tile_size))
+        
+        # draw enclosure fences, each visible enclosure sends its precomputed fence tiles in one blits call
+        # fences and props never share a tile so the order between them doesnt matter
+        enclosures_textures = renderer.enclosures_textures
+        for enclosure in self.enclosures.values():
+            # skip enclosures completely outside the visible tile window
+            if enclosure.x >= i1 or enclosure.x + enclosure.width <= i0 or enclosure.y >= j1 or enclosure.y + enclosure.height <= j0:
+                continue
+            origin_x = base_x + enclosure.x * tile_size
+            origin_y = base_y + enclosure.y * tile_size
+            screen.blits([
+                (enclosures_textures[enclosure_type], (origin_x + i * tile_size, origin_y + j * tile_size))
+                for enclosure_type, i, j in enclosure.fence_tiles
+            ], doreturn=0)
         
         # draw all animals from all enclosures on top of everything
-        for enclosure in self.enclosures:
+        self.draw_animals(base_x, base_y)
+
+
+    def get_background(self):
+        """
+        get the whole ground layer rendered on a single surface
+        the surface is rebuilt when the tile size or the tile textures change
+        
+        returns:
+            pygame surface of the full map ground, or none if it would be too large
+        """
+        tile_size = self.game.tile_size
+        tiles = self.game.renderer.tiles
+        if self.background_key is not None and self.background_key[0] == tile_size and self.background_key[1] is tiles:
+            return self.background
+
+        self.background_key = (tile_size, tiles)
+        self.background = None
+        if self.w * self.h * tile_size * tile_size > BACKGROUND_MAX_PIXELS:
+            return None
+
+        # ground tiles are opaque so the surface doesnt need alpha
+        self.background = pg.Surface((self.w * tile_size, self.h * tile_size)).convert()
+        get_texture = self.game.renderer.get_texture
+        self.background.blits([
+            (get_texture(tile), (i * tile_size, j * tile_size))
+            for j, row in enumerate(self.map)
+            for i, tile in enumerate(row)
+            if tile.texture
+        ], doreturn=0)
+        return self.background
+
+
+    def draw_animals(self, base_x, base_y):
+        """
+        draw every visible animal with a single blits call
+        
+        args:
+            base_x: screen x position of the map origin
+            base_y: screen y position of the map origin
+        """
+        tile_size = self.game.tile_size
+        screen_width, screen_height = self.game.current_res
+        animal_tables = self.game.renderer.animals
+
+        # collect (frame, position) pairs for visible animals, in enclosure order so overlapping sprites keep their layering
+        animal_blits = []
+        for enclosure in self.enclosures.values():
             for animal in enclosure.animals:
-                # get the current animation state (idle or walk)
-                animation = animal.get_current_animation()
+                # convert animal position from tile coordinates to screen pixels
+                screen_x = round(animal.x * tile_size) + base_x
+                screen_y = round(animal.y * tile_size) + base_y
                 
-                # retrieve the current animation frame for the animal
-                animal_frame = self.game.renderer.get_animal_frame(
-                    animal.species,
-                    animation,
-                    animal.direction,
-                    animal.current_frame
-                )
+                # only render if animal is visible on screen
+                if not (-tile_size <= screen_x <= screen_width and -tile_size <= screen_y <= screen_height):
+                    continue
                 
-                if animal_frame:
-                    # convert animal position from tile coordinates to pixels
-                    real_x = animal.x * self.game.tile_size
-                    real_y = animal.y * self.game.tile_size
-                    
-                    # apply camera transformation
-                    screen_x, screen_y = self.game.camera.apply((real_x, real_y))
-                    
-                    # only render if animal is visible on screen
-                    if -self.game.tile_size <= screen_x <= self.game.current_res[0] and \
-                       -self.game.tile_size <= screen_y <= self.game.current_res[1]:
-                        self.game.screen.blit(animal_frame, (screen_x, screen_y))
+                # look the current frame up directly in the renderer tables, same result as
+                # renderer.get_animal_frame without a method call and try block per animal
+                animations = animal_tables.get(animal.species)
+                if animations is None:
+                    continue
+                frames = animations[ANIMATION_NAMES[animal.is_idle]][animal.direction]
+                if not frames:
+                    continue
+                animal_frame = frames[animal.current_frame % len(frames)]
+                
+                animal_blits.append((animal_frame, (screen_x, screen_y)))
+
+        blit_batch(self.game.screen, animal_blits)
 
 
     def create_prop(self, name, x, y):
@@ -161,6 +342,8 @@ class Map:
                     tile = self.get_tile(x + i, y + j)
                     if tile:
                         tile.prop = prop
+        prop_width, prop_height = self.game.renderer.get_prop_size(name)
+        self.refresh_occupancy(x, y, int(prop_width), int(prop_height))
 
     def remove_prop(self, prop):
         """
@@ -178,6 +361,8 @@ class Map:
                 if tile:
                     tile.prop = None
                     tile.main_prop_tile = False
+        prop_width, prop_height = self.game.renderer.get_prop_size(prop.name)
+        self.refresh_occupancy(prop.x, prop.y, int(prop_width), int(prop_height))
 
     def create_enclosure(self, x, y, width, height):
         """
@@ -192,7 +377,7 @@ class Map:
         """
         # create new enclosure instance
         enclosure = Enclosure(x, y, width, height)
-        self.enclosures.append(enclosure)
+        self.enclosures[x, y] = enclosure
 
         # iterate through all tiles in the enclosure area
         for i in range(width):
@@ -223,6 +408,11 @@ class Map:
                         tile.enclosure_type = EnclosureType.LEFT
                     elif i == width - 1:
                         tile.enclosure_type = EnclosureType.RIGHT
+                    
+                    # remember the fence pieces so the enclosure can be drawn without scanning tiles
+                    if tile.enclosure_type is not None:
+                        enclosure.fence_tiles.append((tile.enclosure_type, i, j))
+        self.refresh_occupancy(x, y, width, height)
 
     def remove_enclosure(self, enclosure):
         """
@@ -231,17 +421,20 @@ class Map:
         args:
             enclosure: the enclosure object to remove
         """
-        self.enclosures.remove(enclosure)
+        del self.enclosures[enclosure.x, enclosure.y]
         
-        # clear all tiles in the enclosure area
-        for i in range(enclosure.width):
-            for j in range(enclosure.height):
-                tile = self.get_tile(enclosure.x + i, enclosure.y + j)
-                if tile:
-                    tile.prop = None
-                    tile.is_enclosure = False
-                    tile.main_prop_tile = False
-                    tile.enclosure_type = None
+        # clear all tiles in the enclosure area, walking row slices clipped to the map
+        x0, x1 = max(enclosure.x, 0), min(enclosure.x + enclosure.width, self.w)
+        y0, y1 = max(enclosure.y, 0), min(enclosure.y + enclosure.height, self.h)
+        for row in self.map[y0:y1]:
+            for tile in row[x0:x1]:
+                tile.prop = None
+                tile.is_enclosure = False
+                tile.main_prop_tile = False
+                tile.enclosure_type = None
+        # the whole area is free now
+        for occupancy in self.occupancy[y0:y1]:
+            occupancy[x0:x1] = bytes(x1 - x0)
     
     def generate_random_props(self):
         """
@@ -283,8 +476,8 @@ class Map:
             # with safety margin, we need space up to (x + prop_width + safety_margin - 1, y + prop_height + safety_margin - 1)
             # so: x + prop_width + safety_margin - 1 < len(self.map[0])
             # therefore: x <= len(self.map[0]) - prop_width - safety_margin
-            max_x = len(self.map[0]) - int(prop_width) - safety_margin - 1
-            max_y = len(self.map) - int(prop_height) - safety_margin - 1
+            max_x = self.w - int(prop_width) - safety_margin - 1
+            max_y = self.h - int(prop_height) - safety_margin - 1
             
             # skip if there's not enough space for this prop
             if max_x < margin or max_y < margin:
@@ -302,7 +495,7 @@ class Map:
                     check_x = x + i
                     check_y = y + j
                     # ensure we're still within map boundries
-                    if check_x < 0 or check_x >= len(self.map[0]) or check_y < 0 or check_y >= len(self.map):
+                    if check_x < 0 or check_x >= self.w or check_y < 0 or check_y >= self.h:
                         can_place = False
                         break
                     tile = self.get_tile(check_x, check_y)
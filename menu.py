@@ -4,6 +4,9 @@ import os
 from enum import Enum
 from typing import Callable, Optional, Tuple
 
+from utils import load_image
+
+
 class MenuOption(Enum):
     """
     enumeration for menu options that the user can select
@@ -95,15 +98,15 @@ class Menu:
         self.load_buttons()
         
         # load info screen image
-        self.info_image = pg.image.load("media/hud/backgrounds/info.png").convert_alpha()
+        self.info_image = load_image("media/hud/backgrounds/info.png")
         
         # mouse position offsets for parallax effect
         self.mouse_offset_x = 0
         self.mouse_offset_y = 0
         
         # create close button for info page
-        close_btn_img = pg.image.load("media/hud/buttons/close_2.png").convert_alpha()
-        close_btn_hover = pg.image.load("media/hud/buttons/close_2_hover.png").convert_alpha()
+        close_btn_img = load_image("media/hud/buttons/close_2.png")
+        close_btn_hover = load_image("media/hud/buttons/close_2_hover.png")
         close_btn_img = pg.transform.scale(close_btn_img, (60, 60))
         close_btn_hover = pg.transform.scale(close_btn_hover, (60, 60))
         
@@ -136,7 +139,7 @@ class Menu:
         
         for i, filename in enumerate(background_files):
             path = os.path.join("media/parallax/background", filename)
-            img = pg.image.load(path).convert_alpha()
+            img = load_image(path)
             
             # calculate zoom needed to avoid visible edges
             # add 20% margin for parallax movement
@@ -156,6 +159,9 @@ class Menu:
             
             # last layer (11_background.png) remains fixed
             is_fixed = (i == len(background_files) - 1)
+            if is_fixed:
+                # this layer is fully opaque, dropping its alpha channel gives the faster opaque blit
+                scaled_img = scaled_img.convert()
             
             # files are ordered from CLOSEST to FARTHEST
             # 01 (ground) = index 0 = closest = moves FASTEST
@@ -199,7 +205,7 @@ class Menu:
         
         for i, filename in enumerate(title_files):
             path = os.path.join("media/parallax/title", filename)
-            img = pg.image.load(path).convert_alpha()
+            img = load_image(path)
             
             # 03_fix_title.png stays fixed
             is_fixed = (filename == "03_fix_title.png")
@@ -220,12 +226,12 @@ class Menu:
         play button is larger than info and quit buttons
         """
         # load button images
-        play_img = pg.image.load("media/hud/buttons/play.png").convert_alpha()
-        play_hover = pg.image.load("media/hud/buttons/play_hover.png").convert_alpha()
-        info_img = pg.image.load("media/hud/buttons/info.png").convert_alpha()
-        info_hover = pg.image.load("media/hud/buttons/info_hover.png").convert_alpha()
-        quit_img = pg.image.load("media/hud/buttons/quit.png").convert_alpha()
-        quit_hover = pg.image.load("media/hud/buttons/quit_hover.png").convert_alpha()
+        play_img = load_image("media/hud/buttons/play.png")
+        play_hover = load_image("media/hud/buttons/play_hover.png")
+        info_img = load_image("media/hud/buttons/info.png")
+        info_hover = load_image("media/hud/buttons/info_hover.png")
+        quit_img = load_image("media/hud/buttons/quit.png")
+        quit_hover = load_image("media/hud/buttons/quit_hover.png")
         
         # resize buttons - ALL SQUARE like shop and bulldozer
         # play: larger size (140x140)
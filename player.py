@@ -9,6 +9,7 @@ class Player:
     handles movement, position tracking, inventory management and money
     the player can move around the map and collect items in their inventory
     """
+    __slots__ = ('game', 'x', 'y', 'speed', 'money', 'inventory')
     
     def __init__(self, game, init_pos, speed) -> None:
         """
@@ -75,18 +76,11 @@ class Player:
         applies delta time for smooth frame-independent movement
         enforces map boundaries to keep the visible area within map limits
         """
-        dx, dy = 0, 0
-        
         # check keyboard input for movement direction
+        # each axis is pressed positive minus pressed negative (-1, 0 or 1)
         keys = pg.key.get_pressed()
-        if keys[pg.K_z] or keys[pg.K_w] or keys[pg.K_UP]:
-            dy -= 1  # move up
-        if keys[pg.K_s] or keys[pg.K_DOWN]:
-            dy += 1  # move down
-        if keys[pg.K_q] or keys[pg.K_a] or keys[pg.K_LEFT]:
-            dx -= 1  # move left
-        if keys[pg.K_d] or keys[pg.K_RIGHT]:
-            dx += 1  # move right
+        dx = (keys[pg.K_d] or keys[pg.K_RIGHT]) - (keys[pg.K_q] or keys[pg.K_a] or keys[pg.K_LEFT])
+        dy = (keys[pg.K_s] or keys[pg.K_DOWN]) - (keys[pg.K_z] or keys[pg.K_w] or keys[pg.K_UP])
         
         # check mouse position for edge scrolling
         mouse_x, mouse_y = pg.mouse.get_pos()
@@ -117,8 +111,8 @@ class Player:
         half_screen_tiles_y = (self.game.current_res[1] / self.game.tile_size) / 2
         
         # get actual map dimensions from the game map
-        map_width = len(self.game.map.map[0])  # 70 tiles
-        map_height = len(self.game.map.map)    # 50 tiles
+        map_width = self.game.map.w  # 70 tiles
+        map_height = self.game.map.h  # 50 tiles
         
         # define movement boundaries based on actual map size
         # player must stay within these limits to keep map edges visible
@@ -1,12 +1,34 @@
 from __future__ import annotations
 import pygame as pg
 import os
+from functools import lru_cache
 from random import randint
 
 from utils import *
 from config import *
 
 
+# sliced and scaled animation tables keyed by (spritesheet path, tile size)
+# zoom only cycles through a handful of tile sizes so this stays small
+_FRAMES_CACHE = {}
+
+
+@lru_cache(maxsize=256)
+def load_scaled_image(path, size):
+    """
+    scale a decoded image to the given size, one surface is shared per (path, size)
+    so zooming back to a level already visited reuses the scaled textures
+    
+    args:
+        path: file path to the image
+        size: (width, height) target size in pixels
+        
+    returns:
+        scaled pygame surface with alpha, callers must not draw on it
+    """
+    return pg.transform.scale(load_image(path), size)
+
+
 class Renderer:
     """
     main rendering class that handles all visual assets loading and management
@@ -44,8 +66,8 @@ class Renderer:
             pygame surface with the loaded image or a placeholder
         """
         try:
-            # load with alpha support and avoid unnecessary pixel format conversions
-            tile_image = pg.image.load(image_path).convert_alpha()
+            # decoded once per process by utils.load_image, reloading assets (eg when zooming) reuses it
+            tile_image = load_image(image_path)
     
         except:
             # fallback to a simple colored square if image cant be loaded
@@ -53,6 +75,23 @@ class Renderer:
             tile_image.fill('green')
         return tile_image
     
+    def load_scaled(self, image_path, size):
+        """
+        load an image scaled to the given size through the shared cache
+        images that fail to load get a scaled placeholder instead
+        
+        args:
+            image_path: path to the image file
+            size: (width, height) target size in pixels
+            
+        returns:
+            pygame surface of the requested size
+        """
+        try:
+            return load_scaled_image(image_path, size)
+        except Exception:
+            return pg.transform.scale(self.load_image(image_path), size)
+    
     def load_tiles(self):
         """
         load all ground tiles from the media/tiles directory
@@ -68,8 +107,10 @@ class Renderer:
                 if not (int(file.split('.')[0]) == tiles_count)  :
                     raise ValueError("tile file name must be an integer representing the tile ID")
                 # load original image and then scale smoothly to the game's tile size
-                img = self.load_image(os.path.join('media/tiles', file))
-                tile_image = pg.transform.scale(img, (self.game.tile_size, self.game.tile_size))
+                img = self.load_scaled(os.path.join('media/tiles', file), (self.game.tile_size, self.game.tile_size))
+                # ground tiles are fully opaque, so drop the alpha channel and match the
+                # display format, blits of the whole ground layer then skip per pixel blending
+                tile_image = img.convert()
                 # store the tile with all 4 rotation variants for flexibility
                 self.tiles.append((tile_image, pg.transform.rotate(tile_image, 90), pg.transform.rotate(tile_image, 180), pg.transform.rotate(tile_image, 270)))
             except Exception as e:
@@ -84,7 +125,8 @@ class Renderer:
         """
         for file in os.listdir('media/props'):
             try:
-                img = self.load_image(os.path.join('media/props', file))
+                prop_path = os.path.join('media/props', file)
+                img = self.load_image(prop_path)
                 # calculate target size based on number of tiles this prop occupies
                 target_width = self.props_sizes[file.split('.')[0]][0] * self.game.tile_size
                 target_height = self.props_sizes[file.split('.')[0]][1] * self.game.tile_size
@@ -106,7 +148,7 @@ class Renderer:
                     new_width = int(target_height * original_aspect_ratio)
                 
                 # resize while maintaining aspect ratio
-                tile_image = pg.transform.scale(img, (new_width, new_height))
+                tile_image = self.load_scaled(prop_path, (new_width, new_height))
                 self.props[file.split('.')[0]] = tile_image
             except Exception as e:
                 raise RuntimeError(f"failed to load prop image {file}: {e}")
@@ -158,7 +200,7 @@ class Renderer:
             list of pygame surfaces, each containing one frame
         """
         try :
-            sheet = pg.image.load(path).convert_alpha()
+            sheet = load_image(path)
             sheet_width, sheet_height = sheet.get_size()
 
             frames = []
@@ -185,7 +227,7 @@ class Renderer:
         """
         try :
             # texture id is 1-indexed, list is 0-indexed
-            return self.tiles[tile.texture-1][tile.orientation.value]
+            return self.tiles[tile.texture-1][tile.orientation]
         except IndexError:
             # return 0 as fallback if texture index is out of range
             return 0
@@ -204,8 +246,7 @@ class Renderer:
             try:
                 if not (int(file.split('.')[0]) == enclosure_count)  :
                     raise ValueError("enclosure file name must be an integer representing the enclosure ID")
-                img = self.load_image(os.path.join('media/custom_enclosures', file))
-                tile_image = pg.transform.scale(img, (self.game.tile_size, self.game.tile_size))
+                tile_image = self.load_scaled(os.path.join('media/custom_enclosures', file), (self.game.tile_size, self.game.tile_size))
                 # store as a single image, rotations are handled by using different files
                 self.enclosures_textures.append(tile_image)
             except Exception as e:
@@ -247,9 +288,15 @@ class Renderer:
             if not spritesheet_file:
                 raise RuntimeError(f"no spritesheet found for {animal_name}")
             
+            # reuse the frames already cut for this sheet at the current zoom level
+            frames_key = (spritesheet_file, self.game.tile_size)
+            if frames_key in _FRAMES_CACHE:
+                self.animals[animal_name] = _FRAMES_CACHE[frames_key]
+                continue
+            
             try:
                 # load the complete spritesheet image
-                sheet = pg.image.load(spritesheet_file).convert_alpha()
+                sheet = load_image(spritesheet_file)
                 sheet_width, sheet_height = sheet.get_size()
                 
                 # get the configuration for this specific animal
@@ -285,24 +332,30 @@ class Renderer:
                     }
                 }
                 
+                # scale the used part of the sheet once into an atlas at the current tile size
+                # every frame is then a view into that one surface instead of its own scaled copy
+                atlas = pg.transform.scale(
+                    sheet.subsurface((0, 0, frame_width * max_frames, frame_height * max_row)),
+                    (self.game.tile_size * max_frames, self.game.tile_size * max_row)
+                )
+                
                 # load animations according to configuration
                 for animation in ['walk', 'idle']:
                     for direction in [Direction.NORTH, Direction.SOUTH, Direction.WEST, Direction.EAST]:
                         row_num, num_frames = config[animation][direction]
                         
-                        # calculate Y position of the row (row 1 = index 0)
-                        y = (row_num - 1) * frame_height
+                        # calculate Y position of the row in the atlas (row 1 = index 0)
+                        y = (row_num - 1) * self.game.tile_size
                         
-                        # extract each frame from the row
+                        # extract each frame from the row, already at the game's tile size
                         for frame_num in range(num_frames):
-                            x = frame_num * frame_width
-                            frame = sheet.subsurface((x, y, frame_width, frame_height))
-                            # resize to match game's tile size
-                            scaled_frame = pg.transform.scale(frame, (self.game.tile_size, self.game.tile_size))
-                            animal_animations[animation][direction].append(scaled_frame)
+                            x = frame_num * self.game.tile_size
+                            frame = atlas.subsurface((x, y, self.game.tile_size, self.game.tile_size))
+                            animal_animations[animation][direction].append(frame)
                 
                 # store the complete animation set for this animal
                 self.animals[animal_name] = animal_animations
+                _FRAMES_CACHE[frames_key] = animal_animations
                 
                 
             except Exception as e:
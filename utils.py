@@ -1,17 +1,19 @@
 from __future__ import annotations
 import pygame as pg
 from random import randint
-from enum import Enum
+from enum import IntEnum
 from dataclasses import dataclass
+from functools import lru_cache
 
-class Direction(Enum):
+# int enums so hot paths can index tables and hash members at plain int speed
+class Direction(IntEnum):
     NORTH = 0
     SOUTH = 1
     WEST = 2
     EAST = 3
 
 
-class EnclosureType(Enum):
+class EnclosureType(IntEnum):
     TOP = 0
     BOTTOM = 1
     LEFT = 2
@@ -22,6 +24,23 @@ class EnclosureType(Enum):
     BOTTOM_RIGHT = 7
 
 
+class AnimationState(IntEnum):
+    WALK = 0
+    IDLE = 1
+
+
+# what blocks a rectangle of tiles, see Map.area_state
+class AreaState(IntEnum):
+    FREE = 0
+    OUT_OF_BOUNDS = 1
+    PROP = 2
+    ENCLOSURE = 3
+
+
+# animation names used by the spritesheet config, indexed by AnimationState
+ANIMATION_NAMES = ('walk', 'idle')
+
+
 @dataclass
 class Tile:
     texture: int = None
@@ -41,4 +60,35 @@ class Props:
 
 
 def stick_in_range(value, min_value, max_value):
-    return max(min(value, max_value), min_value)
\ No newline at end of file
+    return max(min(value, max_value), min_value)
+
+
+@lru_cache(maxsize=None)
+def load_image(path: str) -> pg.Surface:
+    """
+    load an image once per process, later calls return the same surface
+    the hud, the menu and the renderer (textures and spritesheets) all share this cache
+    the display mode must already be set since the image is converted with alpha
+    
+    args:
+        path: file path to the image
+    
+    returns:
+        the converted surface, shared between callers so it must not be drawn on
+    """
+    return pg.image.load(path).convert_alpha()
+
+
+def blit_batch(surface: pg.Surface, blits: list) -> None:
+    """
+    draw a sequence of (surface, position) pairs in one call
+    
+    args:
+        surface: surface to draw on, usually the screen
+        blits: blits in drawing order, positions must be (x, y) pairs
+    """
+    # pygame-ce exposes fblits, a faster variant for many blits without return rects
+    if hasattr(surface, 'fblits'):
+        surface.fblits(blits)
+    else:
+        surface.blits(blits, doreturn=0)